@@ -230,6 +230,7 @@ class Agent:
             self.current_session = {
                 'messages': [{"role": "system", "content": self.system_prompt}],
                 'trace': [],
+                'previous_tools': [],  # Names of executed tools, in order (for xray)
                 'turn': 0  # Track conversation turns
             }
             # Start YAML session logging
@@ -297,6 +298,7 @@ class Agent:
             self.current_session = {
                 'messages': [{"role": "system", "content": self.system_prompt}],
                 'trace': [],
+                'previous_tools': [],
                 'turn': 0,
                 'iteration': 1,
                 'user_prompt': 'Manual tool execution'
@@ -1,13 +1,13 @@
 """
 Purpose: Unified logging interface for agents - terminal output + plain text + YAML sessions
 LLM-Note:
-  Dependencies: imports from [datetime, pathlib, typing, yaml, console.py] | imported by [agent.py, tool_executor.py] | tested by [tests/unit/test_logger.py]
+  Dependencies: imports from [atexit, datetime, pathlib, queue, threading, weakref, typing, yaml, console.py] | imported by [agent.py, tool_executor.py] | tested by [tests/unit/test_logger.py]
   Data flow: receives from Agent/tool_executor → delegates to Console for terminal/file → writes YAML sessions to .sb/sessions/
   State/Effects: writes to .sb/sessions/{agent_name}.yaml (one file per agent, appends turns) | delegates file logging to Console | session data persisted after each turn
-  Integration: exposes Logger(agent_name, quiet, log), .print(), .log_tool_call(name, args), .log_tool_result(result, timing), .log_llm_response(), .start_session(), .log_turn()
+  Integration: exposes Logger(agent_name, quiet, log), .print(), .log_tool_call(name, args), .log_tool_result(result, timing), .log_llm_response(), .start_session(), .log_turn(), .flush(), .close()
   Session format: metadata at top → turns summary (with tools_called as function-call style) → system_prompt + messages at end
-  Performance: YAML written after each turn (incremental) | loads existing session file on start | Console delegation is direct passthrough
-  Errors: let I/O errors bubble up (no try-except)
+  Performance: YAML written by a background daemon thread (log_turn only enqueues; thread starts on demand and exits after _WRITER_IDLE_TIMEOUT idle) | session file handle opened once per session and rewritten in place | pending turns coalesced into one write per drain | loads existing session file on start | Console delegation is direct passthrough
+  Errors: I/O errors raised in the writer thread are re-raised on the next log_turn()/flush()/close()
 
 ShadowBar Logger - Unified logging for agents.
 
@@ -17,6 +17,10 @@ This module provides the Logger class that handles:
 - YAML session files for structured data
 """
 
+import atexit
+import queue
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union, Dict, Any
@@ -25,6 +29,34 @@ import yaml
 from .console import Console
 
 
+# Max characters of each argument shown in session tools_called entries
+_ARG_MAX_LEN = 50
+
+# Seconds without queued turns after which a Logger's writer thread exits
+# (the next log_turn() starts a new one)
+_WRITER_IDLE_TIMEOUT = 2.0
+
+# Loggers with a session writer, closed by one atexit hook. Weak, so a Logger
+# (and its session file handle) is freed with its Agent instead of at exit.
+_live_loggers: "weakref.WeakSet[Logger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_loggers():
+    """Flush and close every Logger still alive at interpreter exit."""
+    for logger in list(_live_loggers):
+        try:
+            logger.close()
+        except Exception:
+            pass
+
+
+def _now() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS' (faster than strftime)."""
+    n = datetime.now()
+    return f"{n.year:04d}-{n.month:02d}-{n.day:02d} {n.hour:02d}:{n.minute:02d}:{n.second:02d}"
+
+
 class Logger:
     """Unified logging: terminal output + plain text + YAML sessions.
 
@@ -33,6 +65,12 @@ class Logger:
     Session files use one file per agent (.sb/sessions/{agent_name}.yaml) to
     reduce file clutter. New turns are appended to the same file.
 
+    YAML is written by a background thread so log_turn() never blocks the
+    agent loop on serialization. The thread starts on the first queued turn
+    and exits after _WRITER_IDLE_TIMEOUT seconds without work. Call flush()
+    to wait for pending writes and close() to stop the writer and close the
+    session file (also done automatically at exit).
+
     Args:
         agent_name: Name of the agent (used in filenames)
         quiet: Suppress console output (default False)
@@ -93,6 +131,14 @@ class Logger:
         # Session state (YAML)
         self.session_file: Optional[Path] = None
         self.session_data: Optional[Dict[str, Any]] = None
+        self._session_fd = None  # Kept open for the session; rewritten in place each turn
+
+        # Background writer (started lazily by log_turn, exits when idle)
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()  # Guards starting/retiring the writer
+        self._write_lock = threading.Lock()
+        self._write_error: Optional[BaseException] = None
 
     # Delegate to Console
     def print(self, message: str, style: str = None):
@@ -122,19 +168,14 @@ class Logger:
 
     def _format_tool_call(self, trace_entry: dict) -> str:
         """Format tool call as natural function-call style: greet(name='Alice')"""
-        tool_name = trace_entry.get('tool_name', '')
-        args = trace_entry.get('arguments', {})
         parts = []
-        for k, v in args.items():
-            if isinstance(v, str):
-                v_str = v if len(v) <= 50 else v[:50] + "..."
-                parts.append(f"{k}='{v_str}'")
+        for k, v in trace_entry.get('arguments', {}).items():
+            if v.__class__ is str:
+                parts.append(f"{k}='{v[:_ARG_MAX_LEN]}...'" if len(v) > _ARG_MAX_LEN else f"{k}='{v}'")
             else:
                 v_str = str(v)
-                if len(v_str) > 50:
-                    v_str = v_str[:50] + "..."
-                parts.append(f"{k}={v_str}")
-        return f"{tool_name}({', '.join(parts)})"
+                parts.append(f"{k}={v_str[:_ARG_MAX_LEN]}..." if len(v_str) > _ARG_MAX_LEN else f"{k}={v_str}")
+        return f"{trace_entry.get('tool_name', '')}({', '.join(parts)})"
 
     # Session logging (YAML)
     def start_session(self, system_prompt: str = ""):
@@ -149,21 +190,25 @@ class Logger:
         if not self.enable_sessions:
             return
 
+        # Pending writes must land before the file is re-read
+        self.flush()
+
         sessions_dir = Path(".sb/sessions")
         sessions_dir.mkdir(parents=True, exist_ok=True)
 
         # One file per agent (no timestamp in filename)
         self.session_file = sessions_dir / f"{self.agent_name}.yaml"
 
-        # Load existing session or create new
-        if self.session_file.exists():
-            with open(self.session_file, 'r') as f:
-                self.session_data = yaml.safe_load(f) or {}
+        # Load existing session or create new (same handle is reused for writes)
+        existed = self.session_file.exists()
+        self._open_session_file()
+        if existed:
+            self.session_data = yaml.safe_load(self._session_fd) or {}
             # Ensure ALL required fields exist (handles empty/corrupted files)
             if 'name' not in self.session_data:
                 self.session_data['name'] = self.agent_name
             if 'created' not in self.session_data:
-                self.session_data['created'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.session_data['created'] = _now()
             if 'total_cost' not in self.session_data:
                 self.session_data['total_cost'] = 0.0
             if 'total_tokens' not in self.session_data:
@@ -172,20 +217,100 @@ class Logger:
                 self.session_data['turns'] = []
             if 'messages' not in self.session_data:
                 self.session_data['messages'] = {}
+            if 'messages_saved_count' not in self.session_data:
+                # Older files: count once here instead of on every turn
+                self.session_data['messages_saved_count'] = sum(
+                    len(msgs) for msgs in self.session_data['messages'].values()
+                )
             # Update system_prompt if provided
             if system_prompt:
                 self.session_data['system_prompt'] = system_prompt
         else:
             self.session_data = {
                 "name": self.agent_name,
-                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "created": _now(),
                 "total_cost": 0.0,
                 "total_tokens": 0,
                 "system_prompt": system_prompt,
                 "turns": [],
-                "messages": {}  # Dict keyed by turn number
+                "messages": {},  # Dict keyed by turn number
+                "messages_saved_count": 0  # Running total of messages across turns
             }
 
+    def _open_session_file(self):
+        """Open (or reopen) the session file read/write without truncating it."""
+        if self._session_fd is not None:
+            self._session_fd.close()
+        self.session_file.touch(exist_ok=True)
+        self._session_fd = open(self.session_file, 'r+', encoding='utf-8')
+
+    def _start_writer(self):
+        """Start the background YAML writer thread. Caller holds _writer_lock."""
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name=f"shadowbar-logger-{self.agent_name}",
+            daemon=True
+        )
+        self._writer.start()
+        _live_loggers.add(self)
+
+    def _writer_loop(self):
+        """Drain queued turns and write the session file once per drain; exit when idle."""
+        q = self._write_queue
+        while True:
+            try:
+                first = q.get(timeout=_WRITER_IDLE_TIMEOUT)
+            except queue.Empty:
+                # Retire under the lock so log_turn() either sees this thread
+                # still running (and its turn gets drained) or starts a new one
+                with self._writer_lock:
+                    if q.empty():
+                        self._writer = None
+                        return
+                continue
+            batch = [first]
+            # Coalesce everything already pending into a single write
+            while True:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if any(item is not None for item in batch):
+                    self._write_session()
+            except Exception as e:
+                self._write_error = e
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if None in batch:
+                return
+
+    def _raise_write_error(self):
+        """Re-raise an I/O error from the writer thread in the caller's thread."""
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def flush(self):
+        """Block until all queued turns have been written to the session file."""
+        self._write_queue.join()
+        self._raise_write_error()
+
+    def close(self):
+        """Flush pending turns, stop the background writer and close the session file."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            if writer is not None:
+                self._write_queue.put(None)
+        if writer is not None:
+            writer.join()
+        if self._session_fd is not None:
+            self._session_fd.close()
+            self._session_fd = None
+        _live_loggers.discard(self)
+        self._raise_write_error()
+
     def log_turn(self, user_input: str, result: str, duration_ms: float, session: dict, model: str):
         """Log turn summary + messages to YAML file.
 
@@ -198,20 +323,21 @@ class Logger:
         """
         if not self.enable_sessions or not self.session_data:
             return
-
-        # Aggregate from trace
-        trace = session.get('trace', [])
-        llm_calls = [t for t in trace if t.get('type') == 'llm_call']
-        tool_calls = [t for t in trace if t.get('type') == 'tool_execution']
-
-        total_tokens = sum(
-            (t.get('usage').input_tokens + t.get('usage').output_tokens)
-            for t in llm_calls if t.get('usage')
-        )
-        total_cost = sum(
-            t.get('usage').cost
-            for t in llm_calls if t.get('usage')
-        )
+        self._raise_write_error()
+
+        # Aggregate from trace (single pass)
+        total_tokens = 0
+        total_cost = 0.0
+        tool_calls = []
+        for t in session.get('trace', []):
+            entry_type = t.get('type')
+            if entry_type == 'llm_call':
+                usage = t.get('usage')
+                if usage:
+                    total_tokens += usage.input_tokens + usage.output_tokens
+                    total_cost += usage.cost
+            elif entry_type == 'tool_execution':
+                tool_calls.append(t)
 
         turn_data = {
             'input': user_input,
@@ -225,46 +351,61 @@ class Logger:
             'evaluation': session.get('evaluation', '')
         }
 
-        # Update session aggregates
-        self.session_data['updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.session_data['total_cost'] = round(
-            self.session_data.get('total_cost', 0) + turn_data['cost'], 4
-        )
-        self.session_data['total_tokens'] = (
-            self.session_data.get('total_tokens', 0) + turn_data['tokens']
-        )
-
-        # Add turn number and timestamp
-        turn_num = len(self.session_data['turns']) + 1
-        turn_data['turn'] = turn_num
-        turn_data['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.session_data['turns'].append(turn_data)
-
         # Extract this turn's messages (everything after what we've already saved)
         all_messages = session.get('messages', [])
-        saved_count = sum(len(msgs) for msgs in self.session_data['messages'].values())
+        saved_count = self.session_data['messages_saved_count']
         turn_messages = all_messages[saved_count + 1:]  # +1 to skip system message
-        self.session_data['messages'][turn_num] = turn_messages
 
-        # Write YAML
-        self._write_session()
+        now = _now()
+
+        # Update session aggregates (locked: the writer thread snapshots session_data)
+        with self._write_lock:
+            self.session_data['updated'] = now
+            self.session_data['total_cost'] = round(
+                self.session_data.get('total_cost', 0) + turn_data['cost'], 4
+            )
+            self.session_data['total_tokens'] = (
+                self.session_data.get('total_tokens', 0) + turn_data['tokens']
+            )
+
+            # Add turn number and timestamp
+            turn_num = len(self.session_data['turns']) + 1
+            turn_data['turn'] = turn_num
+            turn_data['timestamp'] = now
+            self.session_data['turns'].append(turn_data)
+            self.session_data['messages'][turn_num] = turn_messages
+            self.session_data['messages_saved_count'] = saved_count + len(turn_messages)
+
+        # Hand off to the background writer (started on demand)
+        with self._writer_lock:
+            if self._writer is None:
+                self._start_writer()
+            self._write_queue.put(turn_data)
 
     def _write_session(self):
         """Write session data with turns summary first, detail at end."""
         # Build ordered dict: compact metadata → turns → detail (system_prompt + messages)
-        ordered = {
-            'name': self.session_data['name'],
-            'created': self.session_data['created'],
-            'updated': self.session_data.get('updated', ''),
-            'total_cost': self.session_data.get('total_cost', 0),
-            'total_tokens': self.session_data.get('total_tokens', 0),
-            'turns': self.session_data['turns'],
-            # Detail section (scroll down)
-            'system_prompt': self.session_data.get('system_prompt', ''),
-            'messages': self.session_data['messages']
-        }
-        with open(self.session_file, 'w', encoding='utf-8') as f:
-            yaml.dump(ordered, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        # Snapshot containers under the lock so log_turn() can keep appending
+        with self._write_lock:
+            ordered = {
+                'name': self.session_data['name'],
+                'created': self.session_data['created'],
+                'updated': self.session_data.get('updated', ''),
+                'total_cost': self.session_data.get('total_cost', 0),
+                'total_tokens': self.session_data.get('total_tokens', 0),
+                'messages_saved_count': self.session_data.get('messages_saved_count', 0),
+                'turns': list(self.session_data['turns']),
+                # Detail section (scroll down)
+                'system_prompt': self.session_data.get('system_prompt', ''),
+                'messages': dict(self.session_data['messages'])
+            }
+        if self._session_fd is None:
+            self._open_session_file()
+        f = self._session_fd
+        f.seek(0)
+        f.truncate()
+        yaml.dump(ordered, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        f.flush()
 
     def load_messages(self) -> list:
         """Load and reconstruct full message list from session file.
@@ -272,6 +413,7 @@ class Logger:
         Returns:
             Full message list: [system_message] + all turn messages in order
         """
+        self.flush()
         if not self.session_file or not self.session_file.exists():
             return []
         with open(self.session_file, 'r', encoding='utf-8') as f:
@@ -290,6 +432,7 @@ class Logger:
 
     def load_session(self) -> dict:
         """Load session data from file."""
+        self.flush()
         if not self.session_file or not self.session_file.exists():
             return {'system_prompt': '', 'turns': [], 'messages': {}}
         with open(self.session_file, 'r') as f:
@@ -3,9 +3,9 @@ Purpose: Load and validate system prompts from files or strings with intelligent
 LLM-Note:
   Dependencies: imports from [os, warnings, pathlib, typing] | imported by [agent.py] | no dedicated tests found
   Data flow: receives system_prompt: Union[str, Path, None] from Agent.__init__ → checks if None (returns DEFAULT_PROMPT) → checks if Path object (reads file) → checks if str exists as file (reads) → warns if looks like file but doesn't exist → returns literal string
-  State/Effects: reads text files if path provided | emits UserWarning if path looks like file but doesn't exist | no writes or global state
+  State/Effects: reads text files if path provided | caches file contents by (absolute path, mtime) | emits UserWarning if path looks like file but doesn't exist | no writes or global state
   Integration: exposes load_system_prompt(prompt), DEFAULT_PROMPT constant | used by Agent to load system prompts from various sources | supports .md, .txt, .prompt file extensions | Path objects enforce file must exist
-  Performance: file I/O only when path provided | heuristic checks (file extension, path separators) are fast string operations
+  Performance: file I/O only when path provided | multi-line str is returned as literal text without a stat() | a single stat() decides exists/is-file | heuristic checks (file extension, path separators) are fast string operations
   Errors: raises FileNotFoundError if Path doesn't exist | raises ValueError if Path is not a file or file is empty | raises ValueError if file not UTF-8 | warns (doesn't fail) for str that looks like missing file
 
 ShadowBar Prompts - System prompt loading utilities.
@@ -16,7 +16,9 @@ This module provides functions for loading system prompts from various sources:
 - Default prompt fallback
 """
 
+import functools
 import os
+import stat
 import warnings
 from pathlib import Path
 from typing import Union
@@ -25,19 +27,19 @@ from typing import Union
 DEFAULT_PROMPT = "You are a helpful assistant that can use tools to complete tasks."
 
 
+# Extensions that mark a string as a prompt file path
+_PROMPT_FILE_SUFFIXES = ('.md', '.txt', '.prompt')
+
+
 def _looks_like_file_path(text: str) -> bool:
     """Check if a string looks like a file path rather than prompt text."""
-    # Check for file extensions
-    has_file_extension = '.' in text and text.split('.')[-1] in ['md', 'txt', 'prompt']
-    # Check for path separators
-    has_path_separator = '/' in text or '\\' in text
-
-    return has_file_extension or has_path_separator
+    # File extension or path separator
+    return text.endswith(_PROMPT_FILE_SUFFIXES) or '/' in text or '\\' in text
 
 
 def _warn_if_missing_file(prompt: str) -> None:
-    """Warn user if prompt looks like a file path but doesn't exist."""
-    if _looks_like_file_path(prompt) and not os.path.exists(prompt):
+    """Warn user if prompt looks like a file path. Caller has already found it doesn't exist."""
+    if _looks_like_file_path(prompt):
         abs_path = os.path.abspath(prompt)
         cwd = os.getcwd()
 
@@ -96,20 +98,31 @@ def load_system_prompt(prompt: Union[str, Path, None]) -> str:
         return DEFAULT_PROMPT
     
     if isinstance(prompt, Path):
-        # Explicit Path object - must exist
-        if not prompt.exists():
+        # Explicit Path object - must exist (one stat for exists + is-file)
+        try:
+            st = prompt.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Prompt file not found: {prompt}")
-        if not prompt.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {prompt}")
-        return _read_text_file(prompt)
+        return _read_text_file(prompt, st.st_mtime_ns)
     
     if isinstance(prompt, str):
-        # Check if it's an existing file
-        if os.path.exists(prompt) and os.path.isfile(prompt):
-            return _read_text_file(Path(prompt))
+        # Multi-line text is never a path: skip the stat and the missing-file warning
+        if '\n' in prompt:
+            return prompt
+
+        # Check if it's an existing file (one stat; prompt text usually fails fast)
+        try:
+            st = os.stat(prompt)
+        except (OSError, ValueError):
+            st = None
+        if st is not None and stat.S_ISREG(st.st_mode):
+            return _read_text_file(Path(prompt), st.st_mtime_ns)
 
         # Warn if it looks like a missing file
-        _warn_if_missing_file(prompt)
+        if st is None:
+            _warn_if_missing_file(prompt)
 
         # Treat as literal prompt text
         return prompt
@@ -117,12 +130,13 @@ def load_system_prompt(prompt: Union[str, Path, None]) -> str:
     raise TypeError(f"Invalid prompt type: {type(prompt).__name__}. Expected str, Path, or None.")
 
 
-def _read_text_file(path: Path) -> str:
+def _read_text_file(path: Path, mtime_ns: int) -> str:
     """
-    Read content from a text file.
+    Read content from a text file, reusing earlier reads of the same unchanged file.
     
     Args:
         path: Path to the text file
+        mtime_ns: File modification time (from the caller's stat), part of the cache key
         
     Returns:
         str: File content
@@ -130,6 +144,13 @@ def _read_text_file(path: Path) -> str:
     Raises:
         ValueError: If file is empty or not valid UTF-8
     """
+    return _read_text_file_cached(os.path.abspath(path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text_file_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a prompt file. Keyed by (absolute path, mtime) so edits on disk invalidate."""
+    path = Path(path_str)
     try:
         content = path.read_text(encoding='utf-8').strip()
         if not content:
@@ -1,11 +1,11 @@
 """
 Purpose: WebSocket relay client for agent-to-agent communication via central relay server using INPUT/OUTPUT protocol
 LLM-Note:
-  Dependencies: imports from [json, asyncio, typing, websockets] | imported by [agent.py] | tested by [tests/test_relay.py]
-  Data flow: Agent.serve() → connect(relay_url) → WebSocket established → send_announce(ws, announce_msg) → serve_loop() → wait_for_task(ws) receives INPUT message from relay → task_handler(prompt) executes → send OUTPUT response via WebSocket → heartbeat re-announces every 60s
-  State/Effects: maintains WebSocket connection to relay | reads incoming JSON messages (INPUT type) | writes outgoing JSON messages (OUTPUT type) | prints status to stdout | asyncio timeout for heartbeat | no file I/O
+  Dependencies: imports from [json, asyncio, struct, typing, websockets, orjson (optional)] | imported by [agent.py] | tested by [tests/test_relay.py]
+  Data flow: Agent.serve() → connect(relay_url) → WebSocket established → send_announce(ws, announce_msg) → serve_loop() → wait_for_task(ws) receives INPUT message from relay (batched JSON-array frames are unpacked one message per call) → task_handler(prompt) executes → send OUTPUT response via WebSocket → heartbeat re-announces every 60s
+  State/Effects: maintains WebSocket connection to relay | reads incoming JSON messages (INPUT type) | writes outgoing OUTPUT messages as length-prefixed binary frames (raw UTF-8 result) | prints status to stdout | asyncio timeout for heartbeat | no file I/O
   Integration: exposes connect(relay_url), send_announce(ws, msg), wait_for_task(ws, timeout), send_response(ws, input_id, result), serve_loop(ws, announce_msg, task_handler, heartbeat_interval) | used by Agent.serve() to make agent discoverable on relay network | task_handler is async function (prompt: str) -> str | Protocol: INPUT/OUTPUT messages (not TASK/RESPONSE)
-  Performance: async/await non-blocking I/O | heartbeat_interval=60s default (configurable) | timeout-based heartbeat scheduling | WebSocket maintains persistent connection
+  Performance: async/await non-blocking I/O | serve_loop writes via one sender task that drains queued frames in batches (queued frames get up to _DRAIN_TIMEOUT to flush on exit) | compact JSON encoding (no whitespace, raw UTF-8) | heartbeat_interval=60s default (configurable) | timeout-based heartbeat scheduling | WebSocket maintains persistent connection
   Errors: let it crash - ImportError if websockets missing | asyncio.TimeoutError used for heartbeat timing | websockets.ConnectionClosed exits serve loop gracefully
 
 ShadowBar Relay Client - WebSocket functions for relay communication.
@@ -20,6 +20,9 @@ or defaults to localhost:8000 for internal deployment.
 import json
 import asyncio
 import os
+import struct
+import weakref
+from collections import deque
 from typing import Dict, Any
 import websockets
 
@@ -28,6 +31,43 @@ import websockets
 DEFAULT_RELAY_URL = os.getenv("SHADOWBAR_RELAY_URL", "ws://localhost:8000/ws/announce")
 
 
+# JSON codec: orjson when installed (pip install shadowbar[speedups]), else stdlib json.
+# Both emit compact UTF-8 JSON text: ANNOUNCE (and non-str OUTPUT results) go out
+# as text frames; str OUTPUT results use binary frames (see _output_frame).
+try:
+    import orjson
+
+    def _dumps(message: Dict[str, Any]) -> str:
+        """Encode a protocol message as compact JSON text."""
+        return orjson.dumps(message).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(message: Dict[str, Any]) -> str:
+        """Encode a protocol message as compact JSON text (no spaces, no \\uXXXX escapes)."""
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+    _loads = json.loads
+
+
+# OUTPUT frames are binary: [4-byte little-endian header length][JSON header]
+# [raw UTF-8 result]. The result is neither JSON-escaped here nor parsed by the relay.
+_FRAME_HEADER = struct.Struct("<I")
+
+
+def _output_frame(input_id: str, result, **fields):
+    """Encode an OUTPUT message; length-prefixed binary when result is a str."""
+    if not isinstance(result, str):
+        return _dumps({"type": "OUTPUT", "input_id": input_id, "result": result, **fields})
+    header = _dumps({"type": "OUTPUT", "input_id": input_id, **fields}).encode("utf-8")
+    return _FRAME_HEADER.pack(len(header)) + header + result.encode("utf-8")
+
+
+# Messages already received but not yet returned by wait_for_task, per connection.
+# The relay sends a JSON array when several messages were queued for an agent.
+_backlog: "weakref.WeakKeyDictionary[Any, deque]" = weakref.WeakKeyDictionary()
+
+
 async def connect(relay_url: str = None):
     """
     Connect to relay WebSocket endpoint.
@@ -64,8 +104,7 @@ async def send_announce(websocket, announce_message: Dict[str, Any]):
         >>> msg = announce.create_announce_message(addr, "My agent", [])
         >>> await send_announce(ws, msg)
     """
-    message_json = json.dumps(announce_message)
-    await websocket.send(message_json)
+    await websocket.send(_dumps(announce_message))
 
 
 async def wait_for_task(websocket, timeout: float = None) -> Dict[str, Any]:
@@ -89,17 +128,28 @@ async def wait_for_task(websocket, timeout: float = None) -> Dict[str, Any]:
         asyncio.TimeoutError: If timeout expires
         websockets.exceptions.ConnectionClosed: If connection lost
 
+    Note:
+        A frame holding a JSON array (batched messages) is returned one
+        message per call; the rest are kept for the next calls.
+
     Example:
         >>> task = await wait_for_task(ws)
         >>> print(task["prompt"])
         Translate hello to Spanish
     """
+    backlog = _backlog.get(websocket)
+    if backlog:
+        return backlog.popleft()
+
     if timeout:
         data = await asyncio.wait_for(websocket.recv(), timeout=timeout)
     else:
         data = await websocket.recv()
 
-    message = json.loads(data)
+    message = _loads(data)
+    if isinstance(message, list):
+        _backlog.setdefault(websocket, deque()).extend(message[1:])
+        return message[0]
     return message
 
 
@@ -123,15 +173,35 @@ async def send_response(
         >>> result = agent.input(task["prompt"])
         >>> await send_response(ws, task["input_id"], result)
     """
-    response_message = {
-        "type": "OUTPUT",
-        "input_id": input_id,
-        "result": result,
-        "success": success
-    }
+    await websocket.send(_output_frame(input_id, result, success=success))
 
-    message_json = json.dumps(response_message)
-    await websocket.send(message_json)
+
+# Max queued frames written per sender wakeup
+_SEND_BATCH_SIZE = 16
+
+
+# Seconds serve_loop waits on exit for queued frames to be written
+_DRAIN_TIMEOUT = 5.0
+
+
+async def _sender(websocket, send_queue: asyncio.Queue):
+    """
+    Single writer for a relay connection.
+
+    Waits for the first queued frame, drains whatever else is already pending
+    (up to _SEND_BATCH_SIZE) and writes the batch back-to-back. Frames are
+    already encoded - text JSON (ANNOUNCE) or binary length-prefixed OUTPUT -
+    and the relay decodes one message per agent frame, so they are sent
+    individually, not joined. (Only relay -> agent INPUTs arrive batched as
+    JSON arrays; see wait_for_task.)
+    """
+    while True:
+        batch = [await send_queue.get()]
+        while len(batch) < _SEND_BATCH_SIZE and not send_queue.empty():
+            batch.append(send_queue.get_nowait())
+        for frame in batch:
+            await websocket.send(frame)
+            send_queue.task_done()
 
 
 async def serve_loop(
@@ -151,7 +221,7 @@ async def serve_loop(
 
     Args:
         websocket: WebSocket connection from connect()
-        announce_message: ANNOUNCE message dict (will be re-sent for heartbeat)
+        announce_message: ANNOUNCE message dict (encoded once, re-sent for heartbeat)
         task_handler: Async function that takes (prompt: str) -> str
         heartbeat_interval: Seconds between heartbeat ANNOUNCEs (default 60)
 
@@ -160,52 +230,70 @@ async def serve_loop(
         ...     return agent.input(prompt)
         >>> await serve_loop(ws, announce_msg, handler)
     """
+    # Encode ANNOUNCE once; heartbeats resend the same signed payload
+    announce_json = _dumps(announce_message)
+
     # Send initial ANNOUNCE
-    await send_announce(websocket, announce_message)
+    await websocket.send(announce_json)
     print(f"✓ Announced to relay: {announce_message['address'][:12]}...")
 
+    # All later writes go through one sender task so receiving never waits on a send
+    send_queue: asyncio.Queue = asyncio.Queue()
+    sender = asyncio.create_task(_sender(websocket, send_queue))
+
     # Track last heartbeat time
     last_heartbeat = asyncio.get_event_loop().time()
 
     # Main loop
-    while True:
-        try:
-            # Wait for message with timeout to allow heartbeat
-            task = await wait_for_task(websocket, timeout=heartbeat_interval)
-
-            # Handle INPUT message
-            if task.get("type") == "INPUT":
-                print(f"→ Received input: {task['input_id'][:8]}...")
-
-                # Process with handler
-                result = await task_handler(task["prompt"])
-
-                # Send OUTPUT response
-                output_message = {
-                    "type": "OUTPUT",
-                    "input_id": task["input_id"],
-                    "result": result
-                }
-                await websocket.send(json.dumps(output_message))
-                print(f"✓ Sent output: {task['input_id'][:8]}...")
-
-            elif task.get("type") == "ERROR":
-                print(f"✗ Error from relay: {task.get('error')}")
-
-        except asyncio.TimeoutError:
-            # Time for heartbeat ANNOUNCE
-            # Update timestamp in message
-            announce_message["timestamp"] = int(asyncio.get_event_loop().time())
-
-            # Need to re-sign with new timestamp
-            # For now, just send without updating signature
-            # TODO: Re-sign message with new timestamp
-            await send_announce(websocket, announce_message)
-            print("♥ Sent heartbeat")
-            last_heartbeat = asyncio.get_event_loop().time()
-
-        except websockets.exceptions.ConnectionClosed:
-            print("✗ Connection to relay closed")
-            break
-
-
+    try:
+        while True:
+            try:
+                # Surface sender failures (e.g. connection closed mid-send)
+                if sender.done():
+                    sender.result()
+
+                # Wait for message with timeout to allow heartbeat
+                task = await wait_for_task(websocket, timeout=heartbeat_interval)
+
+                msg_type = task.get("type")
+
+                # Handle INPUT message
+                if msg_type == "INPUT":
+                    print(f"→ Received input: {task['input_id'][:8]}...")
+
+                    # Process with handler
+                    result = await task_handler(task["prompt"])
+
+                    # Queue OUTPUT response (binary frame, see _output_frame)
+                    send_queue.put_nowait(_output_frame(task["input_id"], result))
+                    print(f"✓ Queued output: {task['input_id'][:8]}...")
+
+                elif msg_type == "ERROR":
+                    print(f"✗ Error from relay: {task.get('error')}")
+
+            except asyncio.TimeoutError:
+                # Time for heartbeat ANNOUNCE
+                # Resend the original signed message: changing the timestamp
+                # without re-signing makes the relay reject the signature.
+                # TODO: Re-sign message with new timestamp (then re-encode here)
+                send_queue.put_nowait(announce_json)
+                print("♥ Queued heartbeat")
+                last_heartbeat = asyncio.get_event_loop().time()
+
+            except websockets.exceptions.ConnectionClosed:
+                print("✗ Connection to relay closed")
+                break
+    finally:
+        # Give queued OUTPUTs a bounded chance to be written before stopping the
+        # sender: join() returns once every queued frame is sent, and a sender
+        # that dies (connection closed) ends the wait early
+        if not sender.done():
+            drained = asyncio.ensure_future(send_queue.join())
+            done, _ = await asyncio.wait({drained, sender}, timeout=_DRAIN_TIMEOUT,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if drained not in done:
+                drained.cancel()
+                print("✗ Stopped with unsent frames")
+        elif not send_queue.empty():
+            print("✗ Stopped with unsent frames")
+        sender.cancel()
@@ -13,9 +13,15 @@ For production deployment, consider:
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
 import json
+import operator
+import struct
 import time
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 
 try:
@@ -28,6 +34,17 @@ except ImportError:
         "Install with: pip install fastapi uvicorn pynacl"
     )
 
+# JSON codec: orjson when installed (pip install shadowbar[speedups]), else stdlib json.
+# Outbound frames are UTF-8 JSON bytes either way (binary frames, no str re-encode).
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    _loads = json.loads
+
 import logging
 
 # Configure logging
@@ -50,21 +67,277 @@ class RegisteredAgent:
     websocket: WebSocket                  # Active WebSocket connection
     last_announce: float = field(default_factory=time.time)
     last_heartbeat: float = field(default_factory=time.time)
+    out_queue: asyncio.Queue = field(default_factory=asyncio.Queue)  # Frames to send
+    writer_task: Optional[asyncio.Task] = None  # Drains out_queue (see agent_writer)
+    summary_lower: str = ""               # summary.lower(), for FIND matching
+    expires_at: float = 0.0               # time.monotonic() deadline for the next ANNOUNCE
+    seq: int = 0                          # Registration order (see _registration_seq)
+
+    def __post_init__(self):
+        self.summary_lower = self.summary.lower()
 
 
 # In-memory agent registry
 # Key: agent address (0x...), Value: RegisteredAgent
 agents: Dict[str, RegisteredAgent] = {}
 
+# Monotonic registration counter; agents[] iterates in the same order as seq
+_registration_seq = itertools.count()
+_seq_of = operator.attrgetter("seq")
+
+# Agents are dropped when no ANNOUNCE arrives for this many seconds
+STALE_THRESHOLD = 120
+
+# Min-heap of (expires_at, address) on the monotonic clock, pushed on every ANNOUNCE.
+# Entries for agents that re-announced since are skipped when popped (lazy deletion).
+agent_deadlines: List[Tuple[float, str]] = []
+
+# Trigram index over lowercased summaries: trigram -> addresses containing it.
+# FIND intersects the query's trigram sets to get candidates, then confirms the
+# substring match, so results are the same as a full scan.
+summary_index: Dict[str, Set[str]] = defaultdict(set)
+
+# Encoded LIST_ALL response, rebuilt lazily after the registry changes
+# (new agent, removed agent, or a changed summary)
+_list_all_frame: Optional[bytes] = None
+
 # Pending INPUT messages waiting for response
-# Key: input_id, Value: {"websocket": WebSocket, "timestamp": float}
+# Key: input_id, Value: {"timestamp": float, "future": asyncio.Future}
+# The future is resolved with the OUTPUT message when the agent responds;
+# input_endpoint owns the client websocket and sends it from there
 pending_inputs: Dict[str, Dict] = {}
 
 
+# HEARTBEAT frames are small and frequent; they are recognised by prefix
+# (compact and default json.dumps spacing) and never decoded
+_HEARTBEAT_PREFIXES = ('{"type":"HEARTBEAT"', '{"type": "HEARTBEAT"')
+
+
+# Binary frames from agents carry an OUTPUT as
+# [4-byte little-endian header length][JSON header][raw UTF-8 result],
+# so large results are neither JSON-escaped nor JSON-parsed
+_FRAME_HEADER = struct.Struct("<I")
+
+
+async def _send(websocket: WebSocket, message: Any):
+    """Send one JSON message as a binary UTF-8 JSON frame."""
+    await websocket.send_bytes(_dumps(message))
+
+
+async def _receive_frame(websocket: WebSocket) -> Union[str, bytes]:
+    """Receive one frame: str for text frames, bytes for binary frames."""
+    frame = await websocket.receive()
+    if frame["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(frame.get("code", 1000))
+    text = frame.get("text")
+    return text if text is not None else frame["bytes"]
+
+
+def _decode_output_frame(data: bytes) -> Dict[str, Any]:
+    """Decode a length-prefixed binary OUTPUT frame into an OUTPUT message.
+
+    Raises:
+        ValueError: If the frame is truncated or its header/result is malformed
+    """
+    if len(data) < _FRAME_HEADER.size:
+        raise ValueError("Binary frame shorter than its length prefix")
+    (header_len,) = _FRAME_HEADER.unpack_from(data)
+    end = _FRAME_HEADER.size + header_len
+    if len(data) < end:
+        raise ValueError(f"Binary frame truncated: header needs {header_len} bytes")
+    message = _loads(data[_FRAME_HEADER.size:end])  # JSON errors are ValueErrors
+    if not isinstance(message, dict):
+        raise ValueError("Binary frame header is not a JSON object")
+    message["result"] = data[end:].decode("utf-8")  # UnicodeDecodeError is a ValueError
+    return message
+
+
+# ============================================================================
+# AGENT REGISTRY
+# ============================================================================
+
+async def agent_writer(agent: RegisteredAgent):
+    """
+    Single writer for an agent's WebSocket.
+
+    Waits for one queued message, drains everything else already queued and
+    sends the batch as one frame: a JSON object for a single message, a JSON
+    array when several were pending. If the send fails, the INPUTs in the
+    batch are failed so their clients get an error right away.
+    """
+    queue = agent.out_queue
+    while True:
+        batch = [await queue.get()]
+        while True:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            await agent.websocket.send_bytes(_dumps(batch[0] if len(batch) == 1 else batch))
+        except asyncio.CancelledError:
+            # Agent unregistered mid-send: delivery is unknown, fail the batch
+            _fail_pending_inputs(batch, "Agent disconnected")
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to {agent.address[:16]}...: {e}")
+            _fail_pending_inputs(batch, str(e))
+
+
+def _fail_pending_inputs(messages: List[Dict[str, Any]], error: str):
+    """Fail the waiting futures of any INPUTs among messages with ConnectionError(error)."""
+    for msg in messages:
+        pending = pending_inputs.get(msg.get("input_id"))
+        if pending and not pending["future"].done():
+            pending["future"].set_exception(ConnectionError(error))
+
+
+def _trigrams(text: str) -> Set[str]:
+    """All 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _index_summary(agent: RegisteredAgent):
+    for trigram in _trigrams(agent.summary_lower):
+        summary_index[trigram].add(agent.address)
+
+
+def _unindex_summary(agent: RegisteredAgent):
+    for trigram in _trigrams(agent.summary_lower):
+        addresses = summary_index.get(trigram)
+        if addresses is not None:
+            addresses.discard(agent.address)
+            if not addresses:
+                del summary_index[trigram]
+
+
+def list_all_frame() -> bytes:
+    """Encoded LIST_ALL response, cached until the registry changes."""
+    global _list_all_frame
+    if _list_all_frame is None:
+        _list_all_frame = _dumps({
+            "type": "AGENTS",
+            "agents": [{
+                "address": agent.address,
+                "summary": agent.summary,
+                "online": True
+            } for agent in agents.values()]
+        })
+    return _list_all_frame
+
+
+def find_agents(query: str, limit: int = 10) -> List[RegisteredAgent]:
+    """Agents whose summary contains query (already lowercased), at most limit.
+
+    Results are in registration order on both paths.
+    """
+    if len(query) < 3:
+        # Too short for the trigram index - scan (agents iterates in registration order)
+        matches = []
+        for agent in agents.values():
+            if query in agent.summary_lower:
+                matches.append(agent)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    trigram_sets = []
+    for trigram in _trigrams(query):
+        addresses = summary_index.get(trigram)
+        if not addresses:
+            return []
+        trigram_sets.append(addresses)
+    trigram_sets.sort(key=len)
+    candidates = trigram_sets[0].intersection(*trigram_sets[1:])
+
+    # Set order varies with hash seeding, so order the confirmed matches by seq;
+    # cost tracks the candidate set, not the registry
+    matches = [agent for agent in map(agents.__getitem__, candidates) if query in agent.summary_lower]
+    if len(matches) > limit:
+        return heapq.nsmallest(limit, matches, key=_seq_of)
+    matches.sort(key=_seq_of)
+    return matches
+
+
+def register_agent(address: str, summary: str, endpoints: list, websocket: WebSocket) -> RegisteredAgent:
+    """Register (or refresh) an agent and make sure its writer task is running."""
+    global _list_all_frame
+    agent = agents.get(address)
+    if agent is not None and agent.websocket is websocket:
+        # Re-announce on the same connection: refresh in place, keep the writer
+        if summary != agent.summary:
+            _unindex_summary(agent)
+            agent.summary = summary
+            agent.summary_lower = summary.lower()
+            _index_summary(agent)
+            _list_all_frame = None
+        agent.endpoints = endpoints
+        agent.last_announce = time.time()
+        agent.expires_at = time.monotonic() + STALE_THRESHOLD
+        heapq.heappush(agent_deadlines, (agent.expires_at, address))
+        return agent
+
+    if agent is not None:
+        # Same address reconnected on a new socket: retire the old writer
+        unregister_agent(address)
+
+    agent = RegisteredAgent(
+        address=address,
+        summary=summary,
+        endpoints=endpoints,
+        websocket=websocket,
+        last_announce=time.time(),
+        expires_at=time.monotonic() + STALE_THRESHOLD,
+        seq=next(_registration_seq)
+    )
+    agent.writer_task = asyncio.create_task(agent_writer(agent))
+    agents[address] = agent
+    _index_summary(agent)
+    _list_all_frame = None
+    heapq.heappush(agent_deadlines, (agent.expires_at, address))
+    return agent
+
+
+def unregister_agent(address: str):
+    """Remove an agent from the registry and stop its writer task."""
+    global _list_all_frame
+    agent = agents.pop(address, None)
+    if agent is None:
+        return
+    _unindex_summary(agent)
+    _list_all_frame = None
+
+    # INPUTs still queued will never be sent: fail them now so their clients
+    # get an error instead of waiting out the input timeout
+    queued = []
+    while True:
+        try:
+            queued.append(agent.out_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    _fail_pending_inputs(queued, "Agent disconnected")
+
+    if agent.writer_task is not None:
+        agent.writer_task.cancel()
+
+
 # ============================================================================
 # SIGNATURE VERIFICATION
 # ============================================================================
 
+@functools.lru_cache(maxsize=1024)
+def _verify_key(public_key_hex: str) -> VerifyKey:
+    """Build (once per agent address) the VerifyKey for a hex public key."""
+    return VerifyKey(bytes.fromhex(public_key_hex))
+
+
+# Last successfully verified ANNOUNCE per public key: (signature_hex, signed fields).
+# Heartbeats resend the identical signed message, so they skip re-serialization
+# and Ed25519 verification. Bounded by clearing when full.
+_MAX_VERIFIED_CACHE = 1024
+_last_verified: Dict[str, tuple] = {}
+
+
 def verify_signature(message: Dict[str, Any]) -> bool:
     """
     Verify Ed25519 signature on ANNOUNCE message.
@@ -92,15 +365,23 @@ def verify_signature(message: Dict[str, Any]) -> bool:
         
         # Create message without signature for verification
         message_to_verify = {k: v for k, v in message.items() if k != "signature"}
+
+        # Same signature over the same fields as last time: already verified
+        cached = _last_verified.get(public_key_hex)
+        if cached is not None and cached[0] == signature_hex and cached[1] == message_to_verify:
+            return True
+
         message_bytes = json.dumps(message_to_verify, sort_keys=True).encode('utf-8')
         
         # Convert hex to bytes
         signature_bytes = bytes.fromhex(signature_hex)
-        public_key_bytes = bytes.fromhex(public_key_hex)
         
-        # Verify using PyNaCl
-        verify_key = VerifyKey(public_key_bytes)
-        verify_key.verify(message_bytes, signature_bytes)
+        # Verify using PyNaCl (key cached per address)
+        _verify_key(public_key_hex).verify(message_bytes, signature_bytes)
+
+        if len(_last_verified) >= _MAX_VERIFIED_CACHE:
+            _last_verified.clear()
+        _last_verified[public_key_hex] = (signature_hex, message_to_verify)
         
         return True
         
@@ -113,6 +394,16 @@ def verify_signature(message: Dict[str, Any]) -> bool:
 # WEBSOCKET ENDPOINTS
 # ============================================================================
 
+async def _reply_to_agent(websocket: WebSocket, agent_address: Optional[str], message: Dict[str, Any]):
+    """Send message on an announce socket, behind agent_writer once the agent is registered."""
+    registered = agents.get(agent_address) if agent_address else None
+    if registered is not None and registered.websocket is websocket:
+        # agent_writer owns this socket once registered - queue behind it
+        registered.out_queue.put_nowait(message)
+    else:
+        await _send(websocket, message)
+
+
 @app.websocket("/ws/announce")
 async def announce_endpoint(websocket: WebSocket):
     """
@@ -121,23 +412,59 @@ async def announce_endpoint(websocket: WebSocket):
     Protocol:
     1. Agent sends ANNOUNCE message
     2. Server stores agent in registry
-    3. Server forwards INPUT messages to agent
-    4. Agent sends OUTPUT messages back
+    3. Server forwards INPUT messages to agent (one JSON object per frame, or a
+       JSON array when several INPUTs were queued together)
+    4. Agent sends OUTPUT messages back (JSON text frames, or length-prefixed
+       binary frames - see _decode_output_frame)
+    
+    Every socket has a single writer: before registration this handler sends
+    directly; afterwards all frames to the agent go through its agent_writer.
     """
     await websocket.accept()
     agent_address = None
+    # Last verified ANNOUNCE frame on this socket and its decoded message
+    announce_frame = None
+    announce_message = None
     
     try:
         while True:
             # Receive message from agent
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            data = await _receive_frame(websocket)
+
+            if isinstance(data, bytes):
+                # Binary frames are length-prefixed OUTPUTs; a bad one is
+                # rejected on its own without dropping the agent
+                try:
+                    message = _decode_output_frame(data)
+                except ValueError as e:
+                    logger.warning(f"Bad binary frame from {agent_address[:16] if agent_address else 'unknown'}...: {e}")
+                    await _reply_to_agent(websocket, agent_address, {
+                        "type": "ERROR",
+                        "error": f"Malformed binary frame: {e}"
+                    })
+                    continue
+            elif data.startswith(_HEARTBEAT_PREFIXES):
+                # Update last seen time
+                if agent_address and agent_address in agents:
+                    agents[agent_address].last_heartbeat = time.time()
+                continue
+            elif data == announce_frame:
+                # Heartbeat re-ANNOUNCE: identical to the frame already verified here
+                register_agent(
+                    agent_address,
+                    summary=announce_message.get("summary", ""),
+                    endpoints=announce_message.get("endpoints", []),
+                    websocket=websocket
+                )
+                continue
+            else:
+                message = _loads(data)
             msg_type = message.get("type")
             
             if msg_type == "ANNOUNCE":
                 # Verify signature
                 if not verify_signature(message):
-                    await websocket.send_json({
+                    await _reply_to_agent(websocket, agent_address, {
                         "type": "ERROR",
                         "error": "Invalid signature"
                     })
@@ -145,12 +472,13 @@ async def announce_endpoint(websocket: WebSocket):
                 
                 # Register agent
                 agent_address = message["address"]
-                agents[agent_address] = RegisteredAgent(
-                    address=agent_address,
+                announce_frame = data
+                announce_message = message
+                register_agent(
+                    agent_address,
                     summary=message.get("summary", ""),
                     endpoints=message.get("endpoints", []),
-                    websocket=websocket,
-                    last_announce=time.time()
+                    websocket=websocket
                 )
                 
                 logger.info(f"✓ Agent registered: {agent_address[:16]}...")
@@ -160,15 +488,10 @@ async def announce_endpoint(websocket: WebSocket):
                 input_id = message.get("input_id")
                 
                 if input_id in pending_inputs:
-                    # Forward response to waiting client
-                    client_ws = pending_inputs[input_id]["websocket"]
-                    try:
-                        await client_ws.send_json(message)
-                        logger.info(f"✓ Forwarded OUTPUT for {input_id[:8]}...")
-                    except Exception as e:
-                        logger.warning(f"Failed to forward OUTPUT: {e}")
-                    finally:
-                        del pending_inputs[input_id]
+                    # Hand the response to the waiting input_endpoint (it sends it)
+                    future = pending_inputs[input_id]["future"]
+                    if not future.done():
+                        future.set_result(message)
                         
             elif msg_type == "HEARTBEAT":
                 # Update last seen time
@@ -180,9 +503,9 @@ async def announce_endpoint(websocket: WebSocket):
     except Exception as e:
         logger.error(f"Error in announce endpoint: {e}")
     finally:
-        # Remove agent from registry
-        if agent_address and agent_address in agents:
-            del agents[agent_address]
+        # Remove agent from registry (unless the address re-registered on another socket)
+        if agent_address and agent_address in agents and agents[agent_address].websocket is websocket:
+            unregister_agent(agent_address)
             logger.info(f"✗ Agent removed: {agent_address[:16]}...")
 
 
@@ -194,7 +517,7 @@ async def input_endpoint(websocket: WebSocket):
     Protocol:
     1. Client sends INPUT message with target agent address
     2. Server routes to agent via their WebSocket
-    3. Server waits for OUTPUT from agent
+    3. Server waits for OUTPUT from agent (resolved by announce_endpoint)
     4. Server forwards OUTPUT to client
     """
     await websocket.accept()
@@ -202,10 +525,10 @@ async def input_endpoint(websocket: WebSocket):
     try:
         # Receive INPUT request
         data = await websocket.receive_text()
-        message = json.loads(data)
+        message = _loads(data)
         
         if message.get("type") != "INPUT":
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "ERROR",
                 "error": "Expected INPUT message"
             })
@@ -217,7 +540,7 @@ async def input_endpoint(websocket: WebSocket):
         prompt = message.get("prompt")
         
         if not all([input_id, target_address, prompt]):
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "ERROR",
                 "error": "Missing required fields: input_id, to, prompt"
             })
@@ -225,7 +548,7 @@ async def input_endpoint(websocket: WebSocket):
         
         # Check if target agent is online
         if target_address not in agents:
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "ERROR",
                 "error": f"Agent not found or offline: {target_address[:16]}..."
             })
@@ -236,49 +559,49 @@ async def input_endpoint(websocket: WebSocket):
         
         # Store pending request
         pending_inputs[input_id] = {
-            "websocket": websocket,
-            "timestamp": time.time()
+            "timestamp": time.time(),
+            "future": asyncio.get_running_loop().create_future()
         }
         
-        # Forward INPUT to agent
+        # Queue INPUT for the agent's writer task (batched with other pending INPUTs)
+        agent.out_queue.put_nowait({
+            "type": "INPUT",
+            "input_id": input_id,
+            "prompt": prompt,
+            "from_address": message.get("from", "unknown")
+        })
+        logger.info(f"→ Forwarded INPUT {input_id[:8]}... to {target_address[:16]}...")
+        
+        # Wait for response (with timeout); announce_endpoint resolves the future
+        timeout = 300  # 5 minutes
         try:
-            await agent.websocket.send_json({
-                "type": "INPUT",
-                "input_id": input_id,
-                "prompt": prompt,
-                "from_address": message.get("from", "unknown")
+            result = await asyncio.wait_for(pending_inputs[input_id]["future"], timeout=timeout)
+        except asyncio.TimeoutError:
+            await _send(websocket, {
+                "type": "ERROR",
+                "error": "Request timed out"
             })
-            logger.info(f"→ Forwarded INPUT {input_id[:8]}... to {target_address[:16]}...")
-        except Exception as e:
-            del pending_inputs[input_id]
-            await websocket.send_json({
+            return
+        except ConnectionError as e:
+            # agent_writer could not deliver the INPUT
+            await _send(websocket, {
                 "type": "ERROR",
                 "error": f"Failed to reach agent: {e}"
             })
             return
+        finally:
+            pending_inputs.pop(input_id, None)
         
-        # Wait for response (with timeout)
-        timeout = 300  # 5 minutes
-        start_time = time.time()
-        
-        while input_id in pending_inputs:
-            if time.time() - start_time > timeout:
-                del pending_inputs[input_id]
-                await websocket.send_json({
-                    "type": "ERROR",
-                    "error": "Request timed out"
-                })
-                return
-            await asyncio.sleep(0.1)
-        
-        # Response was already sent by announce_endpoint
+        # Forward OUTPUT to client (this task is the only writer on the client socket)
+        await _send(websocket, result)
+        logger.info(f"✓ Forwarded OUTPUT for {input_id[:8]}...")
         
     except WebSocketDisconnect:
         logger.info("Client disconnected from /ws/input")
     except Exception as e:
         logger.error(f"Error in input endpoint: {e}")
         try:
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "ERROR",
                 "error": str(e)
             })
@@ -300,7 +623,7 @@ async def lookup_endpoint(websocket: WebSocket):
     
     try:
         data = await websocket.receive_text()
-        message = json.loads(data)
+        message = _loads(data)
         msg_type = message.get("type")
         
         if msg_type == "GET_AGENT":
@@ -308,7 +631,7 @@ async def lookup_endpoint(websocket: WebSocket):
             
             if address in agents:
                 agent = agents[address]
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "AGENT_INFO",
                     "agent": {
                         "address": agent.address,
@@ -319,7 +642,7 @@ async def lookup_endpoint(websocket: WebSocket):
                     }
                 })
             else:
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "AGENT_INFO",
                     "agent": None,
                     "error": "Agent not found or offline"
@@ -328,35 +651,23 @@ async def lookup_endpoint(websocket: WebSocket):
         elif msg_type == "FIND":
             query = message.get("query", "").lower()
             
-            # Simple substring matching (could use embeddings for semantic search)
-            matching_agents = []
-            for agent in agents.values():
-                if query in agent.summary.lower():
-                    matching_agents.append({
-                        "address": agent.address,
-                        "summary": agent.summary,
-                        "endpoints": agent.endpoints,
-                        "last_seen": agent.last_announce
-                    })
+            # Substring matching via the trigram index (could use embeddings for semantic search)
+            matching_agents = [{
+                "address": agent.address,
+                "summary": agent.summary,
+                "endpoints": agent.endpoints,
+                "last_seen": agent.last_announce
+            } for agent in find_agents(query, limit=10)]  # Limit to 10 results
             
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "AGENTS",
                 "query": query,
-                "agents": matching_agents[:10]  # Limit to 10 results
+                "agents": matching_agents
             })
             
         elif msg_type == "LIST_ALL":
-            # List all online agents
-            all_agents = [{
-                "address": agent.address,
-                "summary": agent.summary,
-                "online": True
-            } for agent in agents.values()]
-            
-            await websocket.send_json({
-                "type": "AGENTS",
-                "agents": all_agents
-            })
+            # List all online agents (pre-encoded, shared by all pollers)
+            await websocket.send_bytes(list_all_frame())
             
     except WebSocketDisconnect:
         pass
@@ -409,19 +720,22 @@ async def startup():
 async def cleanup_stale_agents():
     """Remove agents that haven't sent heartbeat in 2 minutes."""
     while True:
-        await asyncio.sleep(30)  # Check every 30 seconds
-        
-        now = time.time()
-        stale_threshold = 120  # 2 minutes
+        # Sleep until the earliest deadline (at least 1s); new agents always
+        # expire later than that, so nothing is missed. Idle relay: 30s.
+        if agent_deadlines:
+            await asyncio.sleep(max(1.0, agent_deadlines[0][0] - time.monotonic()))
+        else:
+            await asyncio.sleep(30)
         
-        stale_addresses = [
-            addr for addr, agent in agents.items()
-            if now - agent.last_announce > stale_threshold
-        ]
+        now = time.monotonic()
         
-        for addr in stale_addresses:
-            del agents[addr]
-            logger.info(f"🧹 Cleaned up stale agent: {addr[:16]}...")
+        # Pop only expired deadlines instead of scanning every agent
+        while agent_deadlines and agent_deadlines[0][0] <= now:
+            _, addr = heapq.heappop(agent_deadlines)
+            agent = agents.get(addr)
+            if agent is not None and agent.expires_at <= now:
+                unregister_agent(addr)
+                logger.info(f"🧹 Cleaned up stale agent: {addr[:16]}...")
 
 
 # ============================================================================
@@ -430,6 +744,7 @@ async def cleanup_stale_agents():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop="auto" runs on uvloop when it is installed (relay-server extra), else asyncio
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto")
 
 
@@ -1,8 +1,8 @@
 """
 Purpose: Execute agent tools with xray context injection, timing, error handling, and trace recording
 LLM-Note:
-  Dependencies: imports from [time, json, typing, xray.py] | imported by [agent.py] | tested by [tests/test_tool_executor.py]
-  Data flow: receives from Agent → tool_calls: List[ToolCall], tools: ToolRegistry, agent: Agent, logger: Logger → for each tool: injects xray context via inject_xray_context() → executes tool_func(**tool_args) → records timing and result → appends to agent.current_session['trace'] → clears xray context → adds tool result to messages
+  Dependencies: imports from [time, json, typing, xray.py, orjson (optional)] | imported by [agent.py] | tested by [tests/test_tool_executor.py]
+  Data flow: receives from Agent → tool_calls: List[ToolCall], tools: ToolRegistry, agent: Agent, logger: Logger → for each tool: injects xray context via inject_xray_context() → executes tool_func(**tool_args) → records timing and result → appends to agent.current_session['trace'] → clears xray context → appends tool name to agent.current_session['previous_tools'] → adds tool result to messages
   State/Effects: mutates agent.current_session['messages'] by appending assistant message with tool_calls and tool result messages | mutates agent.current_session['trace'] by appending tool_execution entries | calls logger.log_tool_call() and logger.log_tool_result() for user feedback | injects/clears xray context via thread-local storage
   Integration: exposes execute_and_record_tools(tool_calls, tools, agent, logger), execute_single_tool(...) | uses logger.log_tool_call(name, args) for natural function-call style output: greet(name='Alice') | creates trace entries with type, tool_name, arguments, call_id, result, status, timing, iteration, timestamp
   Performance: times each tool execution in milliseconds | executes tools sequentially (not parallel) | trace entry added BEFORE auto-trace so xray.trace() sees it
@@ -13,6 +13,15 @@ import time
 import json
 from typing import List, Dict, Any, Optional, Callable
 
+# orjson is optional (pip install shadowbar[speedups]); stdlib json is the fallback
+try:
+    import orjson
+
+    def _dumps_arguments(arguments: Dict[str, Any]) -> str:
+        return orjson.dumps(arguments).decode("utf-8")
+except ImportError:
+    _dumps_arguments = json.dumps
+
 from .xray import (
     inject_xray_context,
     clear_xray_context,
@@ -39,8 +48,12 @@ def execute_and_record_tools(
     # Format and add assistant message with tool calls
     _add_assistant_message(agent.current_session['messages'], tool_calls)
 
+    # Event lists are usually empty - only dispatch when handlers are registered
+    events = agent.events
+
     # before_tools fires ONCE before ALL tools in the batch execute
-    agent._invoke_events('before_tools')
+    if events.get('before_tools'):
+        agent._invoke_events('before_tools')
 
     # Execute each tool
     for tool_call in tool_calls:
@@ -66,17 +79,19 @@ def execute_and_record_tools(
 
         # Fire events AFTER tool result message is added (proper message ordering)
         # on_error fires first for errors/not_found
-        if trace_entry["status"] in ("error", "not_found"):
+        if trace_entry["status"] in ("error", "not_found") and events.get('on_error'):
             agent._invoke_events('on_error')
 
         # after_each_tool fires for EACH tool execution (success, error, not_found)
         # WARNING: Do NOT add messages here - it breaks Anthropic's message ordering
-        agent._invoke_events('after_each_tool')
+        if events.get('after_each_tool'):
+            agent._invoke_events('after_each_tool')
 
     # after_tools fires ONCE after ALL tools in the batch complete
     # This is the safe place to add messages (e.g., reflection) because all
     # tool_results have been added and message ordering is correct for all LLMs
-    agent._invoke_events('after_tools')
+    if events.get('after_tools'):
+        agent._invoke_events('after_tools')
 
 
 def execute_single_tool(
@@ -119,6 +134,10 @@ def execute_single_tool(
         "timestamp": time.time()
     }
 
+    # Names of tools executed earlier in this session (maintained incrementally;
+    # tools only ever see a copy via xray.previous_tools)
+    previous_tools = agent.current_session.setdefault('previous_tools', [])
+
     # Check if tool exists
     tool_func = tools.get(tool_name)
     if tool_func is None:
@@ -131,6 +150,7 @@ def execute_single_tool(
 
         # Add trace entry to session (so on_error handlers can see it)
         agent.current_session['trace'].append(trace_entry)
+        previous_tools.append(tool_name)
 
         # Logger output
         logger.print(f"[red]✗[/red] {error_msg}")
@@ -142,23 +162,24 @@ def execute_single_tool(
     # Check if tool has @xray decorator
     xray_enabled = is_xray_enabled(tool_func)
 
-    # Prepare context data for xray
-    previous_tools = [
-        entry.get("tool_name") for entry in agent.current_session['trace']
-        if entry.get("type") == "tool_execution"
-    ]
+    # Tools only read xray.messages while they run, so the live list is passed;
+    # @xray tools get a snapshot since their Rich table is printed afterwards
+    messages = agent.current_session['messages']
+    if xray_enabled:
+        messages = messages.copy()
 
     # Inject xray context before tool execution
     inject_xray_context(
         agent=agent,
         user_prompt=agent.current_session.get('user_prompt', ''),
-        messages=agent.current_session['messages'].copy(),
+        messages=messages,
         iteration=agent.current_session['iteration'],
-        previous_tools=previous_tools
+        previous_tools=previous_tools.copy()  # live list grows in the finally below
     )
 
-    # Initialize timing (for error case if before_tool fails)
-    tool_start = time.time()
+    # Initialize timing (for error case if before_tool fails); monotonic ns clock,
+    # trace_entry["timestamp"] stays wall-clock
+    tool_start = time.perf_counter_ns()
 
     try:
         # Set pending_tool for before_tool handlers to access
@@ -168,16 +189,17 @@ def execute_single_tool(
             'id': tool_id
         }
 
-        # Invoke before_each_tool events
-        agent._invoke_events('before_each_tool')
+        # Invoke before_each_tool events (skipped when none are registered)
+        if agent.events.get('before_each_tool'):
+            agent._invoke_events('before_each_tool')
 
         # Clear pending_tool after event (it's only valid during before_tool)
         agent.current_session.pop('pending_tool', None)
 
         # Execute the tool with timing (restart timer AFTER events for accurate tool timing)
-        tool_start = time.time()
+        tool_start = time.perf_counter_ns()
         result = tool_func(**tool_args)
-        tool_duration = (time.time() - tool_start) * 1000  # milliseconds
+        tool_duration = (time.perf_counter_ns() - tool_start) / 1_000_000  # milliseconds
 
         # Update trace entry
         trace_entry["timing"] = tool_duration
@@ -205,7 +227,7 @@ def execute_single_tool(
 
     except Exception as e:
         # Calculate timing from initial start (includes before_tool if it succeeded)
-        tool_duration = (time.time() - tool_start) * 1000
+        tool_duration = (time.perf_counter_ns() - tool_start) / 1_000_000
 
         # Update trace entry
         trace_entry["timing"] = tool_duration
@@ -228,6 +250,7 @@ def execute_single_tool(
     finally:
         # Clear xray context after tool execution
         clear_xray_context()
+        previous_tools.append(tool_name)
 
     return trace_entry
 
@@ -250,7 +273,8 @@ def _add_assistant_message(messages: List[Dict], tool_calls: List) -> None:
             "type": "function",
             "function": {
                 "name": tool_call.name,
-                "arguments": json.dumps(tool_call.arguments)
+                # Anthropic returns parsed input, so arguments are serialized here
+                "arguments": _dumps_arguments(tool_call.arguments)
             }
         }
         # Only include extra_content if present (Gemini rejects null values)
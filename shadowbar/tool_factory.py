@@ -1,16 +1,17 @@
 """
 Purpose: Convert Python functions and class methods into agent-compatible tool schemas
 LLM-Note:
-  Dependencies: imports from [inspect, functools, typing] | imported by [agent.py, __init__.py] | tested by [tests/test_tool_factory.py]
+  Dependencies: imports from [inspect, functools, weakref, typing] | imported by [agent.py, __init__.py] | tested by [tests/test_tool_factory.py]
   Data flow: receives func: Callable → inspects signature with inspect.signature() → extracts type hints with get_type_hints() → maps Python types to JSON Schema via TYPE_MAP → creates tool with .name, .description, .to_function_schema(), .run() attributes → returns wrapped Callable
-  State/Effects: no side effects | pure function transformations | preserves @xray and @replay decorator flags via hasattr checks | creates wrapper functions for bound methods to maintain self reference
+  State/Effects: no side effects | pure function transformations | preserves @xray and @replay decorator flags (copied from the underlying function's __dict__) | binds bound methods with functools.partial (self captured, no wrapper frame)
   Integration: exposes create_tool_from_function(func), extract_methods_from_instance(obj), is_class_instance(obj) | used by Agent.__init__ to auto-convert tools | supports both standalone functions and bound methods | skips private methods (starting with _)
-  Performance: uses inspect module (relatively fast) | TYPE_MAP provides O(1) type lookups | caches nothing (recreates on each call)
-  Errors: skips methods without type annotations | skips methods without return type hint | handles inspection failures gracefully | wraps functions with functools.wraps to preserve metadata
+  Performance: uses inspect module (relatively fast) | TYPE_MAP provides O(1) type lookups | parameter schemas memoized per function in a WeakKeyDictionary (inspect.signature/get_type_hints run once per live function; the cache never keeps a function alive)
+  Errors: skips methods without type annotations | skips methods without return type hint | handles inspection failures gracefully | copies metadata onto bound-method partials with functools.update_wrapper
 """
 
 import inspect
 import functools
+import weakref
 from typing import Callable, Dict, Any, get_type_hints, List
 
 # Map Python types to JSON Schema types
@@ -23,35 +24,49 @@ TYPE_MAP = {
     dict: "object",
 }
 
-def create_tool_from_function(func: Callable) -> Callable:
-    """
-    Converts a Python function into a tool that is compatible with the Agent,
-    by inspecting its signature and docstring.
-    """
-    name = func.__name__
-    description = inspect.getdoc(func) or f"Execute the {name} tool."
+# Functions with identical parameter signatures share one (read-only) schema dict
+_schema_by_signature: Dict[tuple, Dict[str, Any]] = {}
+
 
-    # Build the parameters schema from the function signature
+def _build_parameters_schema(func: Callable, bound: bool) -> Dict[str, Any]:
+    """Build the JSON Schema for func's parameters (skipping the bound receiver)."""
     sig = inspect.signature(func)
     type_hints = get_type_hints(func)
-    
-    properties = {}
-    required = []
 
-    for param in sig.parameters.values():
+    params = list(sig.parameters.values())
+    if bound:
+        # func is the underlying function of a bound method - drop self/cls
+        params = params[1:]
+
+    # Signature key: (name, JSON type, required) per parameter
+    key_parts = []
+    for param in params:
         param_name = param.name
-        
+
         # Skip 'self' parameter for bound methods
         if param_name == 'self':
             continue
-            
+
         # Use 'str' as a fallback if no type hint is available
         param_type = type_hints.get(param_name, str)
         schema_type = TYPE_MAP.get(param_type, "string")
-        
-        properties[param_name] = {"type": schema_type}
 
-        if param.default is inspect.Parameter.empty:
+        key_parts.append((param_name, schema_type, param.default is inspect.Parameter.empty))
+
+    sig_key = tuple(key_parts)
+    parameters_schema = _schema_by_signature.get(sig_key)
+    if parameters_schema is None:
+        parameters_schema = _schema_by_signature.setdefault(sig_key, _schema_from_key(sig_key))
+    return parameters_schema
+
+
+def _schema_from_key(sig_key: tuple) -> Dict[str, Any]:
+    """Build the parameters JSON Schema from a signature key."""
+    properties = {}
+    required = []
+    for param_name, schema_type, is_required in sig_key:
+        properties[param_name] = {"type": schema_type}
+        if is_required:
             required.append(param_name)
 
     parameters_schema = {
@@ -60,41 +75,71 @@ def create_tool_from_function(func: Callable) -> Callable:
     }
     if required:
         parameters_schema["required"] = required
-    
-    # For bound methods, create a wrapper function that preserves the method
+    return parameters_schema
+
+
+# func -> {bound: schema}; weak keys so per-request closure tools (and what
+# they capture) are freed once the caller drops them
+_parameters_schema_cache: "weakref.WeakKeyDictionary[Callable, Dict[bool, Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+
+
+def _cached_parameters_schema(func: Callable, bound: bool) -> Dict[str, Any]:
+    """Memoized _build_parameters_schema; falls back to a fresh build for callables that can't be weakly referenced."""
+    try:
+        by_bound = _parameters_schema_cache.get(func)
+    except TypeError:
+        return _build_parameters_schema(func, bound)
+    if by_bound is None:
+        by_bound = _parameters_schema_cache[func] = {}
+    parameters_schema = by_bound.get(bound)
+    if parameters_schema is None:
+        parameters_schema = by_bound[bound] = _build_parameters_schema(func, bound)
+    return parameters_schema
+
+
+def create_tool_from_function(func: Callable) -> Callable:
+    """
+    Converts a Python function into a tool that is compatible with the Agent,
+    by inspecting its signature and docstring.
+    """
+    name = func.__name__
+    description = inspect.getdoc(func) or f"Execute the {name} tool."
+
+    # Build the parameters schema from the function signature (cached per function)
     if inspect.ismethod(func):
-        base_func = getattr(func, "__func__", func)
-
-        @functools.wraps(base_func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        # Preserve decorator flags from the underlying function (for backward compatibility)
-        # Note: xray context is now injected for ALL tools automatically,
-        # so @xray decorator is optional
-        for attr in ("__xray_enabled__", "__replay_enabled__"):
-            if hasattr(base_func, attr):
-                try:
-                    setattr(wrapper, attr, getattr(base_func, attr))
-                except Exception:
-                    pass
+        parameters_schema = _cached_parameters_schema(func.__func__, True)
+    else:
+        parameters_schema = _cached_parameters_schema(func, False)
+
+    # For bound methods, bind self with functools.partial: calls dispatch to the
+    # underlying function from C instead of through an extra Python wrapper frame
+    if inspect.ismethod(func):
+        base_func = func.__func__
+        tool_func = functools.partial(base_func, func.__self__)
+
+        # Copies metadata, __wrapped__ (for source lookup) and the underlying
+        # function's __dict__ - including @xray/@replay flags (kept for
+        # backward compatibility; xray context is injected for ALL tools)
+        functools.update_wrapper(tool_func, base_func)
 
         # Ensure tool naming/docs are consistent for the Agent
-        wrapper.__name__ = name
-        wrapper.__doc__ = description
-        tool_func = wrapper
+        tool_func.__name__ = name
+        tool_func.__doc__ = description
     else:
         tool_func = func
     
     # Attach the necessary attributes for Agent compatibility
     tool_func.name = name
     tool_func.description = description
-    tool_func.get_parameters_schema = lambda: parameters_schema
-    tool_func.to_function_schema = lambda: {
+
+    # Schemas are built once and returned as-is on every LLM turn (treat as read-only)
+    function_schema = {
         "name": name,
         "description": description,
         "parameters": parameters_schema,
     }
+    tool_func.get_parameters_schema = lambda s=parameters_schema: s
+    tool_func.to_function_schema = lambda s=function_schema: s
     tool_func.run = tool_func  # The agent calls .run() - this should be the decorated function
     
     return tool_func
@@ -111,29 +156,37 @@ def extract_methods_from_instance(instance) -> List[Callable]:
         List of method functions that have proper type annotations
     """
     methods = []
-    
-    for name in dir(instance):
-        # Skip private methods (starting with _)
-        if name.startswith('_'):
+
+    # Walk the class dicts along the MRO instead of dir() + getattr on every
+    # name: only callables and classmethods can become bound methods, so
+    # properties and plain values are never evaluated. Subclass definitions
+    # shadow bases.
+    seen = set()
+    candidates = []
+    for klass in type(instance).__mro__:
+        if klass is object:
             continue
-            
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            # Skip private methods (starting with _)
+            if name.startswith('_'):
+                continue
+            # Skip nested classes and non-callables (properties, values)
+            if isinstance(attr, classmethod) or (callable(attr) and not isinstance(attr, type)):
+                candidates.append(name)
+
+    # Keep dir()'s alphabetical tool order
+    for name in sorted(candidates):
         attr = getattr(instance, name)
-        
-        # Check if it's a callable method (not a property or static value)
-        if not callable(attr):
-            continue
-            
-        # Skip built-in methods like __class__, etc.
-        if isinstance(attr, type):
-            continue
-            
+
         # Check if it's actually a bound method (has __self__)
         if not hasattr(attr, '__self__'):
             continue
             
         # Check if method has proper type annotations
         try:
-            sig = inspect.signature(attr)
             type_hints = get_type_hints(attr)
             
             # Must have return type annotation to be a valid tool
@@ -177,10 +230,16 @@ def is_class_instance(obj) -> bool:
     if isinstance(obj, (list, dict, tuple, set, str, int, float, bool, type(None))):
         return False
         
-    # Should have some callable attributes (methods)
-    has_methods = any(
-        callable(getattr(obj, name, None)) and not name.startswith('_')
-        for name in dir(obj)
+    # Should have some callable attributes (methods): probe the class dicts
+    # along the MRO and stop at the first public callable (no dir() sort,
+    # no descriptor invocation)
+    for klass in type(obj).__mro__:
+        for name, attr in vars(klass).items():
+            if not name.startswith('_') and (callable(attr) or isinstance(attr, classmethod)):
+                return True
+
+    # Callables stored on the instance itself
+    return any(
+        not name.startswith('_') and callable(attr)
+        for name, attr in getattr(obj, '__dict__', {}).items()
     )
-    
-    return has_methods
@@ -1,11 +1,11 @@
 """
 Purpose: Store and manage agent tools and class instances with O(1) lookup and conflict detection
 LLM-Note:
-  Dependencies: None (standalone module) | imported by [agent.py] | tested by [tests/unit/test_tool_registry.py]
-  Data flow: Agent.__init__() creates ToolRegistry → .add(tool) stores tool with tool.name key → .add_instance(name, instance) stores class instances → .get(name) returns tool or None → __getattr__ enables agent.tools.send() attribute access → __iter__ yields tools for LLM schema generation
-  State/Effects: stores tools in _tools dict and instances in _instances dict | no file I/O or external effects | raises ValueError on duplicate names or conflicts between tool/instance names
-  Integration: exposes ToolRegistry class with add(), add_instance(), get(), get_instance(), remove(), names() | supports iteration (for tool in registry) | supports len() and bool | supports 'in' operator | attribute access checks instances first, then tools
-  Performance: O(1) dict-based lookup for all operations | iteration yields tools only (not instances) | memory proportional to number of tools/instances
+  Dependencies: imports from [sys, operator] | imported by [agent.py] | tested by [tests/unit/test_tool_registry.py]
+  Data flow: Agent.__init__() creates ToolRegistry → .add(tool) / .add_many(tools) store tools by tool.name key → .add_instance(name, instance) / .add_instances(mapping) store class instances → .get(name) returns tool or None → __getattr__ enables agent.tools.send() attribute access → __iter__ yields tools for LLM schema generation → .iter_names() lazily maps operator.attrgetter('name') over tools
+  State/Effects: stores tools in _tools dict and instances in _instances dict, both mirrored in _lookup for attribute access | no file I/O or external effects | raises ValueError on duplicate names or conflicts between tool/instance names
+  Integration: exposes ToolRegistry class with add(), add_instance(), add_many(), add_instances(), get(), get_instance(), remove(), names(), iter_names() | supports iteration (for tool in registry) | supports len() and bool | supports 'in' operator | attribute access is a single probe of the merged _lookup dict
+  Performance: O(1) dict-based lookup for all operations | keys are sys.intern'ed on insert | add_many/add_instances bind dicts once per batch | iteration yields tools only (not instances) | memory proportional to number of tools/instances
   Errors: raises ValueError for duplicate tool names | raises ValueError if tool name conflicts with instance name | raises AttributeError for unknown tool/instance names via __getattr__
 
 Agent tools and instances with attribute access and conflict detection.
@@ -22,6 +22,8 @@ Usage:
     # API
     agent.tools.add(tool)
     agent.tools.add_instance('gmail', gmail_obj)
+    agent.tools.add_many([send, search])
+    agent.tools.add_instances({'gmail': gmail_obj})
     agent.tools.get('send')
     agent.tools.get_instance('gmail')
 
@@ -30,30 +32,75 @@ Usage:
         print(tool.name)
 """
 
+import sys
+from operator import attrgetter
+
+_name_of = attrgetter("name")
+
 
 class ToolRegistry:
     """Agent tools and class instances with attribute access and conflict detection."""
 
+    __slots__ = ("_tools", "_instances", "_lookup")
+
     def __init__(self):
         self._tools = {}
         self._instances = {}
+        # Instances and tools merged for __getattr__ (names never overlap - see add/add_instance)
+        self._lookup = {}
 
     def add(self, tool):
         """Add a tool. Raises ValueError if name conflicts with existing tool or instance."""
-        name = tool.name
+        # Interned keys: attribute-style lookups (agent.tools.send) use compiler-interned
+        # names, so the key compare in dict lookups is an identity check
+        name = sys.intern(tool.name)
         if name in self._tools:
             raise ValueError(f"Duplicate tool: '{name}'")
         if name in self._instances:
             raise ValueError(f"Tool name '{name}' conflicts with instance name")
         self._tools[name] = tool
+        self._lookup[name] = tool
 
     def add_instance(self, name: str, instance):
         """Add a class instance. Raises ValueError if name conflicts."""
+        name = sys.intern(name)
         if name in self._instances:
             raise ValueError(f"Duplicate instance: '{name}'")
         if name in self._tools:
             raise ValueError(f"Instance name '{name}' conflicts with tool name")
         self._instances[name] = instance
+        self._lookup[name] = instance
+
+    def add_many(self, tools):
+        """Add several tools; same checks as add(), with the dicts bound once for the loop."""
+        tools_d = self._tools
+        instances_d = self._instances
+        lookup_d = self._lookup
+        intern = sys.intern
+        name_of = _name_of
+        for tool in tools:
+            name = intern(name_of(tool))
+            if name in tools_d:
+                raise ValueError(f"Duplicate tool: '{name}'")
+            if name in instances_d:
+                raise ValueError(f"Tool name '{name}' conflicts with instance name")
+            tools_d[name] = tool
+            lookup_d[name] = tool
+
+    def add_instances(self, instances):
+        """Add several class instances from a {name: instance} mapping; same checks as add_instance()."""
+        tools_d = self._tools
+        instances_d = self._instances
+        lookup_d = self._lookup
+        intern = sys.intern
+        for name, instance in instances.items():
+            name = intern(name)
+            if name in instances_d:
+                raise ValueError(f"Duplicate instance: '{name}'")
+            if name in tools_d:
+                raise ValueError(f"Instance name '{name}' conflicts with tool name")
+            instances_d[name] = instance
+            lookup_d[name] = instance
 
     def get(self, name, default=None):
         """Get tool by name."""
@@ -67,6 +114,7 @@ class ToolRegistry:
         """Remove tool by name."""
         if name in self._tools:
             del self._tools[name]
+            del self._lookup[name]
             return True
         return False
 
@@ -74,18 +122,21 @@ class ToolRegistry:
         """List all tool names."""
         return list(self._tools.keys())
 
+    def iter_names(self):
+        """Lazily yield tool names (tool.name) without building a list."""
+        return map(_name_of, self._tools.values())
+
     def __getattr__(self, name):
         """Attribute access: agent.tools.send() or agent.tools.gmail.my_id"""
-        if name.startswith('_'):
-            raise AttributeError(name)
-        # Check instances first (gmail, calendar)
-        if name in self._instances:
-            return self._instances[name]
-        # Then check tools (send, reply)
-        tool = self._tools.get(name)
-        if tool is None:
+        # Dunder probes (copy, pickle, repr, IPython) land here constantly - reject
+        # on the first char and without exception chaining
+        if name[:1] == '_':
+            raise AttributeError(name) from None
+        # Instances (gmail, calendar) and tools (send, reply) in one probe
+        obj = self._lookup.get(name)
+        if obj is None:
             raise AttributeError(f"No tool or instance: '{name}'")
-        return tool
+        return obj
 
     def __iter__(self):
         """Iterate over tools only (for LLM schemas)."""
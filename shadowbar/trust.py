@@ -3,7 +3,7 @@ Purpose: Factory and coordinator for creating trust verification agents with pol
 LLM-Note:
   Dependencies: imports from [os, pathlib, typing, trust_agents.py, trust_functions.py] | imported by [agent.py] | tested by [tests/test_trust.py]
   Data flow: receives trust param from Agent.__init__ → get_default_trust_level() checks SHADOWBAR_ENV → create_trust_agent() validates trust param → returns Agent with trust verification tools OR None
-  State/Effects: reads markdown files if Path/file path provided | checks os.environ for SHADOWBAR_ENV and SHADOWBAR_TRUST | creates Agent instances with trust_verification_tools from trust_functions.py | no writes or global state
+  State/Effects: reads markdown files if Path/file path provided | checks os.environ for SHADOWBAR_ENV and SHADOWBAR_TRUST | creates Agent instances with trust_verification_tools from trust_functions.py | caches the Agent class in module-level _Agent on first use
   Integration: exposes create_trust_agent(trust, api_key, model), get_default_trust_level(), validate_trust_level(level), TRUST_LEVELS constant | used by Agent.__init__ to create self.trust
 
 ShadowBar Trust - Trust verification agent factory.
@@ -22,6 +22,19 @@ from .trust_functions import get_trust_verification_tools
 
 # Trust level constants
 TRUST_LEVELS = ["open", "careful", "strict"]
+_TRUST_LEVELS_SET = frozenset(TRUST_LEVELS)
+_TRUST_LEVELS_JOINED = ", ".join(TRUST_LEVELS)
+
+# SHADOWBAR_ENV value (lowercased) -> default trust level
+_ENV_TO_TRUST = {
+    'development': 'open',
+    'production': 'strict',
+    'staging': 'careful',
+    'test': 'careful',
+}
+
+# Agent class, resolved on the first create_trust_agent() call (circular import)
+_Agent = None
 
 
 def get_default_trust_level() -> Optional[str]:
@@ -36,16 +49,15 @@ def get_default_trust_level() -> Optional[str]:
     Returns:
         Default trust level or None
     """
-    env = os.environ.get('SHADOWBAR_ENV', '').lower()
-    
-    if env == 'development':
-        return 'open'
-    elif env == 'production':
-        return 'strict'
-    elif env in ['staging', 'test']:
-        return 'careful'
-    
-    return None
+    return _ENV_TO_TRUST.get(os.environ.get('SHADOWBAR_ENV', '').lower())
+
+
+def _read_policy(path: Path) -> str:
+    """Read a markdown policy file; one open() instead of exists() + read_text()."""
+    try:
+        return path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Trust policy file not found: {path}") from None
 
 
 def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional[str] = None, model: str = "claude-sonnet-4-5") -> Optional['Agent']:
@@ -67,7 +79,10 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
         ValueError: If trust level is invalid
         FileNotFoundError: If trust policy file doesn't exist
     """
-    from .agent import Agent  # Import here to avoid circular dependency
+    global _Agent
+    if _Agent is None:
+        from .agent import Agent  # Import here to avoid circular dependency
+        _Agent = Agent
     
     # If None, check for environment default
     if trust is None:
@@ -78,7 +93,7 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
             return None  # No trust agent
     
     # If it's already an Agent, validate and return it
-    if isinstance(trust, Agent):
+    if isinstance(trust, _Agent):
         if not trust.tools:
             raise ValueError("Trust agent must have verification tools")
         return trust
@@ -88,10 +103,8 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
     
     # Handle Path object
     if isinstance(trust, Path):
-        if not trust.exists():
-            raise FileNotFoundError(f"Trust policy file not found: {trust}")
-        policy = trust.read_text(encoding='utf-8')
-        return Agent(
+        policy = _read_policy(trust)
+        return _Agent(
             name="trust_agent_custom",
             tools=trust_tools,
             system_prompt=policy,
@@ -104,8 +117,8 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
         trust_lower = trust.lower()
         
         # Check if it's a trust level
-        if trust_lower in TRUST_LEVELS:
-            return Agent(
+        if trust_lower in _TRUST_LEVELS_SET:
+            return _Agent(
                 name=f"trust_agent_{trust_lower}",
                 tools=trust_tools,
                 system_prompt=get_trust_prompt(trust_lower),
@@ -113,18 +126,19 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
                 model=model
             )
         
+        # Scan for each sentinel once; the checks below reuse the results
+        has_newline = '\n' in trust
+        has_separator = '/' in trust or '\\' in trust
+
         # Check if it looks like a trust level but isn't valid
-        if '\n' not in trust and '/' not in trust and '\\' not in trust and ' ' not in trust and len(trust) < 20:
+        if not has_newline and not has_separator and ' ' not in trust and len(trust) < 20:
             if not os.path.exists(trust):
-                raise ValueError(f"Invalid trust level: {trust}. Must be one of: {', '.join(TRUST_LEVELS)}")
+                raise ValueError(f"Invalid trust level: {trust}. Must be one of: {_TRUST_LEVELS_JOINED}")
         
         # Check if it's a file path
-        if '/' in trust or '\\' in trust or trust.endswith('.md'):
-            path = Path(trust)
-            if not path.exists():
-                raise FileNotFoundError(f"Trust policy file not found: {trust}")
-            policy = path.read_text(encoding='utf-8')
-            return Agent(
+        if has_separator or trust.endswith('.md'):
+            policy = _read_policy(Path(trust))
+            return _Agent(
                 name="trust_agent_custom",
                 tools=trust_tools,
                 system_prompt=policy,
@@ -133,11 +147,13 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
             )
         
         # Check if it's a single-line string that could be a file
-        if '\n' not in trust and len(trust) < 100:
-            path = Path(trust)
-            if path.exists():
-                policy = path.read_text(encoding='utf-8')
-                return Agent(
+        if not has_newline and len(trust) < 100:
+            try:
+                policy = Path(trust).read_text(encoding='utf-8')
+            except FileNotFoundError:
+                pass  # Not a file - fall through to inline policy
+            else:
+                return _Agent(
                     name="trust_agent_custom",
                     tools=trust_tools,
                     system_prompt=policy,
@@ -146,7 +162,7 @@ def create_trust_agent(trust: Union[str, Path, 'Agent', None], api_key: Optional
                 )
         
         # It's an inline markdown policy
-        return Agent(
+        return _Agent(
             name="trust_agent_custom",
             tools=trust_tools,
             system_prompt=trust,
@@ -168,6 +184,6 @@ def validate_trust_level(level: str) -> bool:
     Returns:
         True if valid trust level, False otherwise
     """
-    return level.lower() in TRUST_LEVELS
+    return level.lower() in _TRUST_LEVELS_SET
 
 
@@ -1,9 +1,9 @@
 """
 Purpose: Provide pre-configured system prompts for trust agents at different security levels
 LLM-Note:
-  Dependencies: no imports | imported by [trust.py] | tested by [tests/test_trust.py]
+  Dependencies: imports from [functools] | imported by [trust.py] | tested by [tests/test_trust.py]
   Data flow: trust.py calls get_trust_prompt(level) → validates level → returns TRUST_PROMPTS[level] string → used as system_prompt for trust Agent
-  State/Effects: no state or side effects | pure data module
+  State/Effects: no side effects | pure data module | get_trust_prompt memoized with lru_cache (valid levels only; errors are not cached)
 
 ShadowBar Trust Agents - Pre-configured trust prompts.
 
@@ -11,6 +11,8 @@ This module provides system prompts for trust verification agents
 at different security levels: open, careful, and strict.
 """
 
+from functools import lru_cache
+
 # Default trust prompts for each level
 TRUST_PROMPTS = {
     "open": """You are an open trust agent for development environments.
@@ -38,6 +40,9 @@ Requirements for trust:
 Reject any agent that doesn't meet ALL criteria. Security is the top priority."""
 }
 
+# Level names, for error messages
+_TRUST_PROMPT_KEYS_JOINED = ", ".join(TRUST_PROMPTS.keys())
+
 
 def get_open_trust_prompt() -> str:
     """Get the prompt for an open trust agent (development)."""
@@ -54,6 +59,7 @@ def get_strict_trust_prompt() -> str:
     return TRUST_PROMPTS["strict"]
 
 
+@lru_cache(maxsize=8)
 def get_trust_prompt(level: str) -> str:
     """
     Get the trust prompt for a given level.
@@ -69,7 +75,7 @@ def get_trust_prompt(level: str) -> str:
     """
     level_lower = level.lower()
     if level_lower not in TRUST_PROMPTS:
-        raise ValueError(f"Invalid trust level: {level}. Must be one of: {', '.join(TRUST_PROMPTS.keys())}")
+        raise ValueError(f"Invalid trust level: {level}. Must be one of: {_TRUST_PROMPT_KEYS_JOINED}")
     return TRUST_PROMPTS[level_lower]
 
 
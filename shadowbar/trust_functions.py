@@ -1,9 +1,9 @@
 """
 Purpose: Provide tool functions for trust agents to verify other agents
 LLM-Note:
-  Dependencies: imports from [pathlib, typing] | imported by [trust.py] | tested by [tests/test_trust.py]
+  Dependencies: imports from [re, pathlib, typing] | imported by [trust.py] | tested by [tests/test_trust.py]
   Data flow: create_trust_agent() calls get_trust_verification_tools() → returns list of verification functions → these become tools for trust Agent
-  State/Effects: check_whitelist() reads ~/.shadowbar/trusted.txt file if exists | supports wildcard patterns with *
+  State/Effects: check_whitelist() reads ~/.shadowbar/trusted.txt file if exists | parsed whitelist cached per path, re-read when mtime/size change | supports wildcard patterns with *
 
 ShadowBar Trust Functions - Verification tools for trust agents.
 
@@ -13,8 +13,47 @@ This module provides tool functions that trust agents use to verify other agents
 - verify_agent: General agent verification
 """
 
+import re
 from pathlib import Path
-from typing import List, Callable
+from typing import Dict, List, Callable, Optional, Pattern, Set, Tuple
+
+
+# Parsed whitelist per file path:
+# ((st_mtime_ns, st_size), exact ids, wildcard regex or None, {fragment: line}).
+# Re-parsed only when the file's mtime or size changes.
+_whitelist_cache: Dict[str, Tuple[Tuple[int, int], Set[str], Optional[Pattern], Dict[str, str]]] = {}
+
+
+def _load_whitelist(whitelist_path: Path) -> Tuple[Set[str], Optional[Pattern], Dict[str, str]]:
+    """Return (exact ids, wildcard regex, {fragment: line}); raises FileNotFoundError if missing.
+
+    All wildcard fragments are compiled into one alternation, so an id is
+    checked against every pattern with a single regex search.
+    """
+    st = whitelist_path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cache_key = str(whitelist_path)
+    cached = _whitelist_cache.get(cache_key)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2], cached[3]
+
+    exact = set()
+    wildcards = {}
+    for line in whitelist_path.read_text(encoding='utf-8').strip().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if '*' in line:
+            # Simple wildcard support: the line minus '*' must occur in the id
+            wildcards.setdefault(line.replace('*', ''), line)
+        else:
+            exact.add(line)
+
+    # A bare '*' (empty fragment) matches every id; check_whitelist handles it last
+    fragments = [fragment for fragment in wildcards if fragment]
+    wildcard_re = re.compile('|'.join(map(re.escape, fragments))) if fragments else None
+    _whitelist_cache[cache_key] = (key, exact, wildcard_re, wildcards)
+    return exact, wildcard_re, wildcards
 
 
 def check_whitelist(agent_id: str) -> str:
@@ -28,25 +67,22 @@ def check_whitelist(agent_id: str) -> str:
         String indicating if agent is whitelisted or not
     """
     whitelist_path = Path.home() / ".shadowbar" / "trusted.txt"
-    if whitelist_path.exists():
-        try:
-            whitelist = whitelist_path.read_text(encoding='utf-8')
-            lines = whitelist.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if line == agent_id:
-                    return f"{agent_id} is on the whitelist"
-                # Simple wildcard support
-                if '*' in line:
-                    pattern = line.replace('*', '')
-                    if pattern in agent_id:
-                        return f"{agent_id} matches whitelist pattern: {line}"
-            return f"{agent_id} is NOT on the whitelist"
-        except Exception as e:
-            return f"Error reading whitelist: {e}"
-    return "No whitelist file found at ~/.shadowbar/trusted.txt"
+    try:
+        exact, wildcard_re, wildcards = _load_whitelist(whitelist_path)
+    except FileNotFoundError:
+        return "No whitelist file found at ~/.shadowbar/trusted.txt"
+    except Exception as e:
+        return f"Error reading whitelist: {e}"
+
+    if agent_id in exact:
+        return f"{agent_id} is on the whitelist"
+    if wildcard_re is not None:
+        match = wildcard_re.search(agent_id)
+        if match:
+            return f"{agent_id} matches whitelist pattern: {wildcards[match.group(0)]}"
+    if '' in wildcards:
+        return f"{agent_id} matches whitelist pattern: {wildcards['']}"
+    return f"{agent_id} is NOT on the whitelist"
 
 
 def test_capability(agent_id: str, test: str, expected: str) -> str:
@@ -1,10 +1,10 @@
 """
 Purpose: Terminal UI components for interactive agent interfaces with powerline-style rendering
 LLM-Note:
-  Dependencies: imports from [input, dropdown, providers, keys, fuzzy, status_bar, divider, pick, footer] | imported by [useful_tools/__init__.py, useful_tools/terminal.py] | requires rich library
+  Dependencies: lazily imports from [input, dropdown, providers, keys, fuzzy, status_bar, divider, pick, footer] on first attribute access | imported by [useful_tools/__init__.py, useful_tools/terminal.py] | requires rich library
   Data flow: agent/CLI imports TUI components -> components render to terminal via Rich -> user interacts via keyboard -> components return selected values
   State/Effects: manages terminal state during interaction | raw mode for keyboard input | restores terminal on exit
-  Integration: exposes Input (text with autocomplete), Dropdown, FileProvider/StaticProvider (autocomplete sources), StatusBar/SimpleStatusBar/ProgressSegment, Divider, pick (single-select), Footer | keyboard handling via getch/read_key | fuzzy matching via fuzzy_match/highlight_match
+  Integration: exposes Input (text with autocomplete), Dropdown, FileProvider/StaticProvider (autocomplete sources), StatusBar/SimpleStatusBar/ProgressSegment, Divider, pick (single-select), Footer | keyboard handling via getch/read_key/read_key_nowait, RawMode for a whole input loop | fuzzy matching via fuzzy_match/highlight_match
   Performance: renders to terminal in real-time | fuzzy matching is O(n*m) | file provider reads filesystem
   Errors: KeyboardInterrupt handled for clean exit | terminal restoration on exception
 
@@ -28,15 +28,46 @@ Usage:
     console.print(Divider().render())
 """
 
-from .input import Input
-from .dropdown import Dropdown, DropdownItem
-from .providers import FileProvider, StaticProvider
-from .keys import getch, read_key
-from .fuzzy import fuzzy_match, highlight_match
-from .status_bar import StatusBar, SimpleStatusBar, ProgressSegment
-from .divider import Divider
+import importlib
+
+# Eager: the function shares its submodule's name, and a direct
+# `import shadowbar.tui.pick` would otherwise leave the module bound here
 from .pick import pick
-from .footer import Footer
+
+# Public name -> submodule. Submodules are imported on first attribute access
+# (PEP 562), so e.g. importing Divider does not load input/providers/status_bar.
+_LAZY = {
+    "Input": "input",
+    "Dropdown": "dropdown",
+    "DropdownItem": "dropdown",
+    "FileProvider": "providers",
+    "StaticProvider": "providers",
+    "getch": "keys",
+    "RawMode": "keys",
+    "read_key": "keys",
+    "read_key_nowait": "keys",
+    "fuzzy_match": "fuzzy",
+    "highlight_match": "fuzzy",
+    "StatusBar": "status_bar",
+    "SimpleStatusBar": "status_bar",
+    "ProgressSegment": "status_bar",
+    "Divider": "divider",
+    "Footer": "footer",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "Input",
@@ -45,7 +76,9 @@ __all__ = [
     "FileProvider",
     "StaticProvider",
     "getch",
+    "RawMode",
     "read_key",
+    "read_key_nowait",
     "fuzzy_match",
     "highlight_match",
     "StatusBar",
@@ -30,10 +30,29 @@ class Divider:
             char: Character to use for the line
             style: Rich style for the line
         """
-        self.width = width
-        self.char = char
+        self._width = width
+        self._char = char
+        self._line = char * width  # Built once; rebuilt only when width/char change
         self.style = style
 
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        self._width = value
+        self._line = self._char * value
+
+    @property
+    def char(self) -> str:
+        return self._char
+
+    @char.setter
+    def char(self, value: str):
+        self._char = value
+        self._line = value * self._width
+
     def render(self) -> Text:
         """Render the divider line."""
-        return Text(self.char * self.width, style=self.style)
+        return Text(self._line, style=self.style)
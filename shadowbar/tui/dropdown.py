@@ -4,6 +4,7 @@ Modern zsh-style dropdown with icons and highlighting.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from rich.text import Text
@@ -13,7 +14,7 @@ from rich.console import Group
 from .fuzzy import highlight_match
 
 
-@dataclass
+@dataclass(slots=True)
 class DropdownItem:
     """Structured item for dropdown display.
 
@@ -48,6 +49,7 @@ class DropdownItem:
     subtitle: str = ""              # Third line or additional context
     icon: str = ""                  # Left icon (emoji or nerd font)
     style: str = ""                 # Rich style for the display text
+    highlighted: Text | None = field(default=None, repr=False, compare=False)  # highlight_match(display, positions), set by Dropdown.set_items
 
     @classmethod
     def from_tuple(cls, item: tuple) -> "DropdownItem":
@@ -88,24 +90,31 @@ ICONS = {
 }
 
 
+# Extension (lowercase) -> icon
+_EXT_ICONS = {
+    "py": ICONS["python"],
+    "js": ICONS["javascript"],
+    "jsx": ICONS["javascript"],
+    "ts": ICONS["typescript"],
+    "tsx": ICONS["typescript"],
+    "json": ICONS["json"],
+    "md": ICONS["markdown"],
+    "mdx": ICONS["markdown"],
+    "yml": ICONS["yaml"],
+    "yaml": ICONS["yaml"],
+}
+_DEFAULT_ICON = ICONS["default"]
+
+
+@lru_cache(maxsize=512)
 def get_file_icon(name: str) -> str:
-    """Get icon for file based on extension."""
+    """Get icon for file based on extension (memoized - providers repeat names per keystroke)."""
     if name.endswith('/'):
         return ICONS["folder"]
-    ext = name.rsplit('.', 1)[-1].lower() if '.' in name else ""
-    if ext == "py":
-        return ICONS["python"]
-    elif ext in ("js", "jsx"):
-        return ICONS["javascript"]
-    elif ext in ("ts", "tsx"):
-        return ICONS["typescript"]
-    elif ext == "json":
-        return ICONS["json"]
-    elif ext in ("md", "mdx"):
-        return ICONS["markdown"]
-    elif ext in ("yml", "yaml"):
-        return ICONS["yaml"]
-    return ICONS["default"]
+    dot = name.rfind('.')
+    if dot < 0:
+        return _DEFAULT_ICON
+    return _EXT_ICONS.get(name[dot + 1:].lower(), _DEFAULT_ICON)
 
 
 class Dropdown:
@@ -138,6 +147,9 @@ class Dropdown:
         self.show_icons = show_icons
         self.items: list[DropdownItem] = []
         self.selected_index = 0
+        # Unselected form of each row, built once per set_items (navigation
+        # only changes which row is selected)
+        self._row_cache: list[Text] | None = None
 
     def set_items(self, items: list):
         """Set items. Accepts DropdownItem or old tuple format."""
@@ -147,13 +159,20 @@ class Dropdown:
                 converted.append(item)
             else:
                 converted.append(DropdownItem.from_tuple(item))
+        # Highlight once here instead of on every render (memoized provider
+        # results come back already highlighted)
+        for item in converted:
+            if item.highlighted is None:
+                item.highlighted = highlight_match(item.display, item.positions)
         self.items = converted
         self.selected_index = 0
+        self._row_cache = None
 
     def clear(self):
         """Clear all items."""
         self.items = []
         self.selected_index = 0
+        self._row_cache = None
 
     @property
     def is_empty(self) -> bool:
@@ -203,41 +222,17 @@ class Dropdown:
         """
         table = Table(show_header=False, box=None, padding=(0, 0), show_edge=False)
 
+        if self._row_cache is None:
+            self._row_cache = [self._render_row(item, False) for item in self.items]
+
         for i, item in enumerate(self.items):
             is_selected = i == self.selected_index
-            row = Text()
 
-            # Selection indicator
             if is_selected:
-                row.append("  ❯ ", style="bold green")
+                table.add_row(self._render_row(item, True))
             else:
-                row.append("    ", style="dim")
-
-            # Icon
-            icon = self._get_icon(item)
-            if icon:
-                if is_selected:
-                    row.append(f"{icon} ", style="bold")
-                else:
-                    row.append(f"{icon} ", style="dim")
-
-            # Main display text with highlighting
-            display_style = item.style if item.style else ""
-            highlighted = highlight_match(item.display, item.positions)
-            if display_style:
-                highlighted.stylize(display_style)
-            row.append_text(highlighted)
-
-            # Description (right side, dimmed)
-            if item.description:
-                row.append("  ", style="dim")
-                row.append(item.description, style="dim italic")
-
-            # Add background to selected row
-            if is_selected:
-                row.stylize("on bright_black")
-
-            table.add_row(row)
+                # Copy so Rich never sees the cached Text itself
+                table.add_row(self._row_cache[i].copy())
 
             # Subtitle as second line (only for selected or all items with subtitle)
             if item.subtitle and is_selected:
@@ -249,3 +244,42 @@ class Dropdown:
                 table.add_row(subtitle_row)
 
         return table
+
+    def _render_row(self, item: DropdownItem, is_selected: bool) -> Text:
+        """Build one item row: indicator, icon, highlighted display, description."""
+        row = Text()
+
+        # Selection indicator
+        if is_selected:
+            row.append("  ❯ ", style="bold green")
+        else:
+            row.append("    ", style="dim")
+
+        # Icon
+        icon = self._get_icon(item)
+        if icon:
+            if is_selected:
+                row.append(f"{icon} ", style="bold")
+            else:
+                row.append(f"{icon} ", style="dim")
+
+        # Main display text with highlighting
+        display_style = item.style if item.style else ""
+        highlighted = item.highlighted
+        if highlighted is None:
+            highlighted = highlight_match(item.display, item.positions)
+        if display_style:
+            highlighted = highlighted.copy()  # stylize mutates; keep the precomputed Text clean
+            highlighted.stylize(display_style)
+        row.append_text(highlighted)
+
+        # Description (right side, dimmed)
+        if item.description:
+            row.append("  ", style="dim")
+            row.append(item.description, style="dim italic")
+
+        # Add background to selected row
+        if is_selected:
+            row.stylize("on bright_black")
+
+        return row
@@ -22,10 +22,5 @@ class Footer:
         self.tips = tips
 
     def render(self) -> Text:
-        """Render tips."""
-        out = Text()
-        for i, tip in enumerate(self.tips):
-            out.append(tip, style="dim")
-            if i < len(self.tips) - 1:
-                out.append("  ", style="dim")
-        return out
+        """Render tips (one dim-styled Text, no per-tip spans)."""
+        return Text("  ".join(self.tips), style="dim")
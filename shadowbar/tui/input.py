@@ -5,14 +5,16 @@ Inspired by powerlevel10k terminal prompts.
 """
 
 import random
+import signal
+import threading
+import time
 from typing import Optional
 from rich.console import Console, Group
 from rich.text import Text
 from rich.live import Live
 
-from .keys import read_key
+from .keys import RawMode, read_key, read_key_nowait
 from .dropdown import Dropdown
-from .providers import FileProvider
 
 
 # Color palette - works on both light and dark terminals
@@ -25,8 +27,11 @@ COLORS = {
     "tip": "dim italic",
 }
 
-# Global counter for rotating tips
-_input_count = 0
+# Default prompt per style
+PROMPTS = {"modern": "? ", "minimal": "> ", "classic": "$ "}
+
+# Max time spent draining pending keys before a frame is drawn (~60fps)
+_FRAME_BUDGET = 0.016
 
 
 class Input:
@@ -49,6 +54,9 @@ class Input:
         ).run()
     """
 
+    # Inputs run so far, across all instances (drives tip rotation)
+    _input_count = 0
+
     def __init__(
         self,
         prompt: str = None,
@@ -63,7 +71,7 @@ class Input:
         """
         Args:
             prompt: Custom prompt text
-            triggers: Dict of {char: Provider} for autocomplete
+            triggers: Dict of {char: Provider} for autocomplete (single-char keys)
             hints: Always-visible keyboard hints (e.g., ["/ commands", "Enter submit"])
             tips: Rotating tips shown occasionally (e.g., ["Try /today", "Join Discord"])
             divider: Add horizontal dividers around input
@@ -73,6 +81,11 @@ class Input:
         """
         self.prompt = prompt
         self.triggers = triggers or {}
+        # Keys arrive one char at a time, so a longer trigger could never fire;
+        # single chars also let the handlers below strip a trigger with buffer[:-1]
+        bad = [t for t in self.triggers if len(t) != 1]
+        if bad:
+            raise ValueError(f"Triggers must be single characters, got: {bad}")
         self.hints = hints
         self.tips = tips
         self.divider = divider
@@ -85,23 +98,94 @@ class Input:
         self.active_trigger = None
         self.filter_text = ""
         self.dropdown = Dropdown(max_visible=max_visible)
+        self._submitted = False
+        # (active_trigger, filter_text) the dropdown items were last searched for
+        self._last_update_key = None
+
+        # Optional provider hooks (see Provider), looked up once per trigger instead
+        # of type-checking providers on every key
+        self._on_accept = {t: getattr(p, "on_accept", None) for t, p in self.triggers.items()}
+        self._on_backspace = {t: getattr(p, "on_backspace", None) for t, p in self.triggers.items()}
+        self._on_exit = [
+            hook for hook in (getattr(p, "on_exit", None) for p in self.triggers.values()) if hook
+        ]
+
+        # Invariant pieces of each frame, built once (prompt/hints are fixed config)
+        self._prompt_text = self._render_prompt()
+        self._hint_line = self._render_hints() if hints else None
+        self._divider_width = None
+        self._divider_text = None
+        self._line_key = None
+        self._line_text = None
+        self._tip_text = None
+        # Console width, cached while run() has a SIGWINCH handler installed
+        # (None = query the terminal on next use)
+        self._width = None
+        self._watching_resize = False
+        self._prev_winch = None
 
     def _render_prompt(self) -> Text:
         """Render prompt based on style."""
         if self.prompt:
             return Text(self.prompt)
 
-        prompts = {"modern": "? ", "minimal": "> ", "classic": "$ "}
-        return Text(prompts.get(self.style, "? "), style=COLORS["prompt"])
+        return Text(PROMPTS.get(self.style, "? "), style=COLORS["prompt"])
+
+    def _render_hints(self) -> Text:
+        """Render the always-visible hint line."""
+        hint_line = Text()
+        for i, hint in enumerate(self.hints):
+            hint_line.append(hint, style=COLORS["hint"])
+            if i < len(self.hints) - 1:
+                hint_line.append("  ")
+        return hint_line
+
+    def _console_width(self) -> int:
+        """Console width; a terminal size query only after a resize while run() is active."""
+        width = self._width
+        if width is None:
+            width = self.console.width or 80
+            if self._watching_resize:
+                self._width = width
+        return width
+
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler: drop the cached width and chain to any previous handler."""
+        self._width = None
+        if callable(self._prev_winch):
+            self._prev_winch(signum, frame)
+
+    def _watch_resize(self):
+        """Install the SIGWINCH handler (POSIX main thread only, else width is queried per frame)."""
+        if not hasattr(signal, "SIGWINCH") or threading.current_thread() is not threading.main_thread():
+            return
+        self._prev_winch = signal.signal(signal.SIGWINCH, self._on_resize)
+        self._watching_resize = True
+
+    def _unwatch_resize(self):
+        """Restore the previous SIGWINCH handler."""
+        if self._watching_resize:
+            prev = self._prev_winch
+            signal.signal(signal.SIGWINCH, prev if prev is not None else signal.SIG_DFL)
+            self._watching_resize = False
+            self._width = None
+
+    def _get_divider(self) -> Text:
+        """Full-width divider, rebuilt only when the console width changes."""
+        width = self._console_width()
+        if width != self._divider_width:
+            self._divider_width = width
+            self._divider_text = Text("-" * width, style="dim bright_black")
+        return self._divider_text
 
     def _get_rotating_tip(self) -> str | None:
         """Get a rotating tip (shows every 4 inputs, 60% chance)."""
-        global _input_count
         if not self.tips:
             return None
+        count = Input._input_count
         # Show tip every 4 rounds with 60% probability
-        if _input_count % 4 == 0 and random.random() < 0.6:
-            return self.tips[(_input_count // 4) % len(self.tips)]
+        if count % 4 == 0 and random.random() < 0.6:
+            return self.tips[count // 4 % len(self.tips)]
         return None
 
     def _render(self) -> Group:
@@ -110,17 +194,22 @@ class Input:
 
         # Top divider (very dim solid line, full width)
         if self.divider:
-            width = self.console.width or 80
-            parts.append(Text("-" * width, style="dim bright_black"))
-
-        # Input line: prompt + buffer + filter + cursor
-        line = self._render_prompt()
-        if self.buffer:
-            line.append(self.buffer)  # Default terminal color
-        if self.active_trigger:
-            line.append(self.filter_text, style=COLORS["filter"])
-        line.append(" ", style=COLORS["cursor"])
-        parts.append(line)
+            divider = self._get_divider()
+            parts.append(divider)
+
+        # Input line: prompt + buffer + filter + cursor. Kept across frames and
+        # rebuilt only when its text changes (arrow keys only touch the dropdown).
+        line_key = (self.buffer, self.active_trigger, self.filter_text)
+        if line_key != self._line_key:
+            line = self._prompt_text.copy()
+            if self.buffer:
+                line.append(self.buffer)  # Default terminal color
+            if self.active_trigger:
+                line.append(self.filter_text, style=COLORS["filter"])
+            line.append(" ", style=COLORS["cursor"])
+            self._line_key = line_key
+            self._line_text = line
+        parts.append(self._line_text)
 
         # Dropdown
         if self.active_trigger and not self.dropdown.is_empty:
@@ -129,22 +218,15 @@ class Input:
 
         # Bottom divider (very dim solid line, full width)
         if self.divider:
-            width = self.console.width or 80
-            parts.append(Text("-" * width, style="dim bright_black"))
+            parts.append(divider)
 
         # Hints (always visible, under divider)
-        if self.hints:
-            hint_line = Text()
-            for i, hint in enumerate(self.hints):
-                hint_line.append(hint, style=COLORS["hint"])
-                if i < len(self.hints) - 1:
-                    hint_line.append("  ")
-            parts.append(hint_line)
-
-        # Rotating tip (occasional, under hints)
-        tip = self._get_rotating_tip()
-        if tip:
-            parts.append(Text(tip, style=COLORS["tip"]))
+        if self._hint_line is not None:
+            parts.append(self._hint_line)
+
+        # Rotating tip (occasional, under hints), rolled once per run()
+        if self._tip_text is not None:
+            parts.append(self._tip_text)
 
         return Group(*parts)
 
@@ -154,125 +236,154 @@ class Input:
         if value is None:
             return False
 
-        # Directory navigation for FileProvider
-        if isinstance(value, str) and value.endswith('/'):
-            provider = self.triggers.get(self.active_trigger)
-            if isinstance(provider, FileProvider):
-                provider.enter(value)
-                self.filter_text = ""
-                self._update_dropdown()
-                return True
+        # Provider-side navigation (e.g. FileProvider entering a directory)
+        on_accept = self._on_accept.get(self.active_trigger)
+        if on_accept is not None and on_accept(value):
+            self.filter_text = ""
+            self._last_update_key = None  # Provider state changed under the same filter
+            self._update_dropdown()
+            return True
 
         # Accept selection
-        if self.active_trigger and self.buffer.endswith(self.active_trigger):
-            self.buffer = self.buffer[:-len(self.active_trigger)]
+        if self.active_trigger and self.buffer[-1:] == self.active_trigger:
+            self.buffer = self.buffer[:-1]
         self.buffer += str(value)
         self._exit_autocomplete()
         return False
 
     def _update_dropdown(self):
-        """Update dropdown from provider."""
+        """Update dropdown from provider (skipped if trigger and filter are unchanged)."""
+        update_key = (self.active_trigger, self.filter_text)
+        if update_key == self._last_update_key:
+            return
         provider = self.triggers.get(self.active_trigger)
         if provider:
             self.dropdown.set_items(provider.search(self.filter_text))
         else:
             self.dropdown.clear()
+        self._last_update_key = update_key
 
     def _exit_autocomplete(self):
         """Exit autocomplete mode."""
         self.active_trigger = None
         self.filter_text = ""
         self.dropdown.clear()
-        for provider in self.triggers.values():
-            if isinstance(provider, FileProvider):
-                provider.context = ""
+        self._last_update_key = None
+        for on_exit in self._on_exit:
+            on_exit()
 
-    def run(self) -> str:
-        """Run input loop. Returns entered text."""
-        global _input_count
-        _input_count += 1
-
-        with Live(self._render(), console=self.console, auto_refresh=False) as live:
-            while True:
-                key = read_key()
-
-                # Enter - submit or accept selection
-                if key in ('\r', '\n'):
-                    if self.active_trigger:
-                        if not self.dropdown.is_empty:
-                            if self._accept_selection():
-                                live.update(self._render(), refresh=True)
-                                continue
-                            live.update(self._render(), refresh=True)
-                        else:
-                            self._exit_autocomplete()
-                            live.update(self._render(), refresh=True)
-                    else:
-                        return self.buffer
+    def _handle_key(self, key: str) -> bool:
+        """Apply one key to the input state. Returns True if the UI needs a re-render.
 
-                # Tab - accept selection
-                elif key == '\t':
-                    if self.active_trigger and not self.dropdown.is_empty:
-                        if self._accept_selection():
-                            live.update(self._render(), refresh=True)
-                            continue
-                        live.update(self._render(), refresh=True)
+        Enter with no active trigger sets self._submitted instead.
+        """
+        # Enter - submit or accept selection
+        if key in ('\r', '\n'):
+            if self.active_trigger:
+                if not self.dropdown.is_empty:
+                    self._accept_selection()
+                else:
+                    self._exit_autocomplete()
+                return True
+            self._submitted = True
+            return False
 
-                # Escape - cancel autocomplete
-                elif key == 'esc':
-                    if self.active_trigger:
-                        if self.buffer.endswith(self.active_trigger):
-                            self.buffer = self.buffer[:-1]
-                        self._exit_autocomplete()
-                        live.update(self._render(), refresh=True)
+        # Tab - accept selection
+        if key == '\t':
+            if self.active_trigger and not self.dropdown.is_empty:
+                self._accept_selection()
+                return True
+            return False
 
-                # Ctrl+C / Ctrl+D
-                elif key == '\x03':
-                    raise KeyboardInterrupt()
-                elif key == '\x04':
-                    raise EOFError()
-
-                # Backspace
-                elif key in ('\x7f', '\x08'):
-                    if self.active_trigger:
-                        if self.filter_text:
-                            self.filter_text = self.filter_text[:-1]
-                            self._update_dropdown()
-                        else:
-                            provider = self.triggers.get(self.active_trigger)
-                            if isinstance(provider, FileProvider) and provider.context:
-                                provider.back()
-                                self._update_dropdown()
-                            else:
-                                if self.buffer.endswith(self.active_trigger):
-                                    self.buffer = self.buffer[:-1]
-                                self._exit_autocomplete()
-                        live.update(self._render(), refresh=True)
-                    elif self.buffer:
-                        self.buffer = self.buffer[:-1]
-                        live.update(self._render(), refresh=True)
+        # Escape - cancel autocomplete
+        if key == 'esc':
+            if self.active_trigger:
+                if self.buffer[-1:] == self.active_trigger:
+                    self.buffer = self.buffer[:-1]
+                self._exit_autocomplete()
+                return True
+            return False
 
-                # Arrow keys
-                elif key == 'up' and self.active_trigger:
-                    self.dropdown.up()
-                    live.update(self._render(), refresh=True)
-                elif key == 'down' and self.active_trigger:
-                    self.dropdown.down()
-                    live.update(self._render(), refresh=True)
-
-                # Trigger char
-                elif key in self.triggers:
-                    self.active_trigger = key
-                    self.filter_text = ""
-                    self.buffer += key
+        # Ctrl+C / Ctrl+D
+        if key == '\x03':
+            raise KeyboardInterrupt()
+        if key == '\x04':
+            raise EOFError()
+
+        # Backspace
+        if key in ('\x7f', '\x08'):
+            if self.active_trigger:
+                if self.filter_text:
+                    self.filter_text = self.filter_text[:-1]
                     self._update_dropdown()
-                    live.update(self._render(), refresh=True)
-
-                # Regular input
-                elif key.isprintable():
-                    if self.active_trigger:
-                        self.filter_text += key
+                else:
+                    on_backspace = self._on_backspace.get(self.active_trigger)
+                    if on_backspace is not None and on_backspace():
+                        self._last_update_key = None  # Provider state changed under the same filter
                         self._update_dropdown()
                     else:
-                        self.buffer += key
-                    live.update(self._render(), refresh=True)
+                        if self.buffer[-1:] == self.active_trigger:
+                            self.buffer = self.buffer[:-1]
+                        self._exit_autocomplete()
+                return True
+            if self.buffer:
+                self.buffer = self.buffer[:-1]
+                return True
+            return False
+
+        # Arrow keys
+        if key == 'up' and self.active_trigger:
+            self.dropdown.up()
+            return True
+        if key == 'down' and self.active_trigger:
+            self.dropdown.down()
+            return True
+
+        # Trigger char
+        if key in self.triggers:
+            self.active_trigger = key
+            self.filter_text = ""
+            self.buffer += key
+            self._update_dropdown()
+            return True
+
+        # Regular input
+        if key.isprintable():
+            if self.active_trigger:
+                self.filter_text += key
+                self._update_dropdown()
+            else:
+                self.buffer += key
+            return True
+        return False
+
+    def run(self) -> str:
+        """Run input loop. Returns entered text."""
+        Input._input_count += 1
+        self._submitted = False
+        # Pick this round's tip once; re-rolling per frame made it flicker
+        tip = self._get_rotating_tip()
+        self._tip_text = Text(tip, style=COLORS["tip"]) if tip else None
+
+        self._watch_resize()
+        try:
+            # Raw mode once for the whole loop instead of per key read
+            with RawMode(), Live(self._render(), console=self.console, auto_refresh=False) as live:
+                while True:
+                    dirty = self._handle_key(read_key())
+
+                    # Apply keys that are already pending (fast typing, paste) before
+                    # rendering, so a burst costs one frame instead of one per key
+                    deadline = time.monotonic() + _FRAME_BUDGET
+                    while not self._submitted and time.monotonic() < deadline:
+                        key = read_key_nowait()
+                        if key is None:
+                            break
+                        dirty = self._handle_key(key) or dirty
+
+                    if dirty:
+                        live.update(self._render(), refresh=True)
+                    if self._submitted:
+                        return self.buffer
+        finally:
+            self._unwatch_resize()
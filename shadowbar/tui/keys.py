@@ -1,22 +1,152 @@
 """Low-level keyboard input primitives."""
 
+import os
 import sys
+import time
+from types import MappingProxyType
+
+try:
+    import select
+    import termios
+except ImportError:  # Windows - keys come from msvcrt
+    termios = None
+
+# Final byte of an 'ESC [ x' sequence -> key name (read-only, shared by all parses)
+_ARROWS = MappingProxyType({'A': 'up', 'B': 'down', 'C': 'right', 'D': 'left'})
+
+# How long a lone ESC waits for the rest of an escape sequence
+_ESC_TIMEOUT = 0.02
+
+# Nesting depth of active RawMode blocks (terminal is raw while > 0)
+_raw_depth = 0
+
+# Read-ahead buffer: one os.read pulls a whole paste, keys are then parsed from memory
+_READ_SIZE = 4096
+_buffer = bytearray()
+
+
+class RawMode:
+    """Keep the terminal in raw input mode for a whole input loop.
+
+    Entering raw mode per character costs three termios calls per byte.
+    Input.run and pick enter it once instead, and read_key/getch skip their
+    own setup while a RawMode block is active. Output processing (OPOST)
+    stays on so Rich rendering is unaffected. Nested blocks are no-ops.
+    No-op on Windows.
+
+    Usage:
+        with RawMode():
+            key = read_key()
+    """
+
+    def __init__(self, fd: int = None):
+        self.fd = sys.stdin.fileno() if fd is None and termios is not None else fd
+        self._old = None
+
+    def __enter__(self):
+        global _raw_depth
+        if termios is not None and _raw_depth == 0:
+            self._old = termios.tcgetattr(self.fd)
+            mode = termios.tcgetattr(self.fd)
+            # tty.setraw minus the output flags; TCSANOW keeps keys typed ahead
+            mode[0] &= ~(termios.BRKINT | termios.ICRNL | termios.INPCK | termios.ISTRIP | termios.IXON)
+            mode[2] &= ~(termios.CSIZE | termios.PARENB)
+            mode[2] |= termios.CS8
+            mode[3] &= ~(termios.ECHO | termios.ICANON | termios.IEXTEN | termios.ISIG)
+            mode[6][termios.VMIN] = 1
+            mode[6][termios.VTIME] = 0
+            termios.tcsetattr(self.fd, termios.TCSANOW, mode)
+        _raw_depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        global _raw_depth
+        _raw_depth -= 1
+        if self._old is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._old)
+            self._old = None
+        return False
+
+
+def _take(fd: int, n: int) -> bytes:
+    """Up to n bytes from the read-ahead buffer, refilling it from fd as needed."""
+    while len(_buffer) < n:
+        chunk = os.read(fd, _READ_SIZE)
+        if not chunk:
+            break
+        _buffer.extend(chunk)
+    data = bytes(_buffer[:n])
+    del _buffer[:n]
+    return data
+
+
+def _read_char(fd: int) -> str:
+    """Read one UTF-8 character from fd via the read-ahead buffer.
+
+    Bypasses sys.stdin's own buffer so _pending() can see every byte that
+    has been read but not yet parsed (see read_key_nowait).
+    """
+    first = _take(fd, 1)
+    if not first:
+        return ''
+    lead = first[0]
+    if lead < 0x80:
+        return first.decode()
+    extra = 3 if lead >= 0xF0 else 2 if lead >= 0xE0 else 1
+    return (first + _take(fd, extra)).decode('utf-8', errors='ignore')
+
+
+def _pending(fd: int, timeout: float) -> bool:
+    """True if input is buffered, or readable on fd within timeout seconds."""
+    if _buffer:
+        return True
+    ready, _, _ = select.select([fd], [], [], timeout)
+    return bool(ready)
+
+
+def take_typeahead() -> str:
+    """Text read ahead but not yet consumed, up to and including the first Enter.
+
+    For handing off to line input (input()) after a raw-mode loop: bytes
+    already pulled into the read-ahead buffer are invisible to sys.stdin.
+    Anything after the first Enter stays buffered for the next read_key().
+    """
+    end = len(_buffer)
+    for i, byte in enumerate(_buffer):
+        if byte in (0x0D, 0x0A):  # \r, \n
+            end = i + 1
+            break
+    data = bytes(_buffer[:end])
+    del _buffer[:end]
+    return data.decode('utf-8', errors='ignore')
+
+
+def _parse_key(fd: int) -> str:
+    """Read one key from a raw-mode fd.
+
+    States: plain char -> done | ESC -> wait briefly for '[' (else lone 'esc')
+    | ESC [ -> final byte picks the arrow ('esc' for anything else).
+    """
+    ch = _read_char(fd)
+    if ch != '\x1b':
+        return ch
+    if not _pending(fd, _ESC_TIMEOUT):
+        return 'esc'
+    if _read_char(fd) != '[':
+        return 'esc'
+    return _ARROWS.get(_read_char(fd), 'esc')
 
 
 def getch() -> str:
     """Read single character without waiting for Enter."""
-    try:
-        import termios
-        import tty
-        fd = sys.stdin.fileno()
-        old = termios.tcgetattr(fd)
-        tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        termios.tcsetattr(fd, termios.TCSADRAIN, old)
-        return ch
-    except ImportError:
+    if termios is None:
         import msvcrt
         return msvcrt.getch().decode('utf-8', errors='ignore')
+    fd = sys.stdin.fileno()
+    if _raw_depth:
+        return _read_char(fd)
+    with RawMode(fd):
+        return _read_char(fd)
 
 
 def read_key() -> str:
@@ -25,11 +155,38 @@ def read_key() -> str:
     Returns:
         Single char, or 'up'/'down'/'left'/'right' for arrows, 'esc' for escape
     """
-    ch = getch()
-    if ch == '\x1b':
-        ch2 = getch()
-        if ch2 == '[':
-            ch3 = getch()
-            return {'A': 'up', 'B': 'down', 'C': 'right', 'D': 'left'}.get(ch3, 'esc')
-        return 'esc'
-    return ch
+    if termios is None:
+        ch = getch()
+        if ch == '\x1b':
+            if getch() == '[':
+                return _ARROWS.get(getch(), 'esc')
+            return 'esc'
+        return ch
+    fd = sys.stdin.fileno()
+    if _raw_depth:
+        return _parse_key(fd)
+    with RawMode(fd):
+        return _parse_key(fd)
+
+
+def read_key_nowait(timeout: float = 0.0) -> str | None:
+    """Like read_key(), but return None if no key arrives within timeout seconds.
+
+    Used to drain keys that are already pending (fast typing, paste) so the
+    caller can apply them all and render once.
+    """
+    if termios is None:
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(0.001)
+        return read_key()
+
+    fd = sys.stdin.fileno()
+    # Raw mode while polling: in canonical mode the tty holds typed chars until Enter
+    with RawMode(fd):
+        if not _pending(fd, timeout):
+            return None
+        return _parse_key(fd)
@@ -5,7 +5,7 @@ LLM-Note:
   Data flow: caller invokes pick(title, options, other) -> renders menu with Rich Live -> reads keyboard via read_key() -> up/down arrows move selection -> Enter confirms -> returns selected label string | if other=True and "Other..." selected, prompts for custom text input
   State/Effects: uses Rich Live for in-place rendering | manages cursor position state | reads raw keyboard input | no file I/O
   Integration: exposes pick(title, options, other, console) -> str | options can be strings or (label, description) tuples | optional "Other..." for custom input | returns selected label or custom text
-  Performance: O(n) options rendering | single keystroke per action | real-time re-render on selection change
+  Performance: O(n) options rendering once, then only the old and new selected rows are rebuilt per move | single keystroke per action
   Errors: KeyboardInterrupt returns None or empty string | terminal restored on exit
 
 Usage:
@@ -25,10 +25,25 @@ Usage:
 """
 
 import sys
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.text import Text
-from .keys import read_key
+from .keys import RawMode, read_key, take_typeahead
+
+
+def _build_footer() -> Text:
+    """Key hints under the menu (identical for every pick call)."""
+    footer = Text()
+    footer.append("??", style="cyan")
+    footer.append(" navigate  ", style="dim")
+    footer.append("1-9", style="cyan")
+    footer.append(" jump  ", style="dim")
+    footer.append("Enter", style="cyan")
+    footer.append(" select", style="dim")
+    return footer
+
+
+_FOOTER = _build_footer()
 
 
 def pick(title: str, options: list, other: bool = False, console: Console = None) -> str:
@@ -46,12 +61,10 @@ def pick(title: str, options: list, other: bool = False, console: Console = None
     console = console or Console()
 
     # Normalize options to (label, description) tuples
-    items = []
-    for opt in options:
-        if isinstance(opt, str):
-            items.append((opt, ""))
-        else:
-            items.append((opt[0], opt[1] if len(opt) > 1 else ""))
+    items = [
+        (opt, "") if isinstance(opt, str) else (opt[0], opt[1] if len(opt) > 1 else "")
+        for opt in options
+    ]
     if other:
         items.append(("Other...", ""))
 
@@ -59,27 +72,37 @@ def pick(title: str, options: list, other: bool = False, console: Console = None
     total = len(items)
     lines = total + 4  # title + blank + options + blank + footer
 
-    def render() -> Text:
-        out = Text()
-        out.append(f"{title}\n\n", style="bold")
-        for i, (label, desc) in enumerate(items):
-            if i == selected:
-                out.append(f"  ? {i+1}  {label}", style="bold cyan")
-            else:
-                out.append(f"    {i+1}  ", style="dim cyan")
-                out.append(label, style="dim")
-            if desc:
-                out.append(f"  {desc}", style="dim")
-            out.append("\n")
-        # Footer with key hints
-        out.append("\n")
-        out.append("??", style="cyan")
-        out.append(" navigate  ", style="dim")
-        out.append("1-9", style="cyan")
-        out.append(" jump  ", style="dim")
-        out.append("Enter", style="cyan")
-        out.append(" select", style="dim")
-        return out
+    def render_row(i: int, is_selected: bool) -> Text:
+        label, desc = items[i]
+        row = Text()
+        if is_selected:
+            row.append(f"  ? {i+1}  {label}", style="bold cyan")
+        else:
+            row.append(f"    {i+1}  ", style="dim cyan")
+            row.append(label, style="dim")
+        if desc:
+            row.append(f"  {desc}", style="dim")
+        return row
+
+    # Both variants of every row, built once: moving the selection only swaps
+    # the old and new rows' panels, with no Text construction per frame
+    plain_rows = [render_row(i, False) for i in range(total)]
+    selected_rows = [render_row(i, True) for i in range(total)]
+
+    # Persistent panels: title, blank, one Text per option, blank, footer
+    panels = [Text(title, style="bold"), Text()]
+    panels.extend(plain_rows)
+    panels[2 + selected] = selected_rows[selected]
+    panels.extend([Text(), _FOOTER])
+
+    def move_to(idx: int):
+        nonlocal selected
+        old, selected = selected, idx
+        panels[2 + old] = plain_rows[old]
+        panels[2 + idx] = selected_rows[idx]
+
+    def render() -> Group:
+        return Group(*panels)
 
     def show_result(text: str):
         sys.stdout.write(f"\033[{lines}A\033[J")  # Clear menu
@@ -92,7 +115,13 @@ def pick(title: str, options: list, other: bool = False, console: Console = None
     def get_other_input() -> str:
         sys.stdout.write(f"\033[{lines}A\033[J")  # Clear menu
         console.print(f"[bold]{title}[/]")
-        return input("  -> ")
+        # Keys typed ahead during the menu loop are already in keys' buffer, not stdin
+        typed = take_typeahead()
+        if typed.endswith(("\r", "\n")):
+            line = typed.rstrip("\r\n")
+            print(f"  -> {line}")
+            return line
+        return typed + input(f"  -> {typed}")
 
     def handle_select(idx: int) -> str:
         if other and idx == total - 1:
@@ -104,27 +133,27 @@ def pick(title: str, options: list, other: bool = False, console: Console = None
     # Hide cursor and run
     print("\033[?25l", end="", flush=True)
     try:
-        with Live(render(), console=console, auto_refresh=False) as live:
+        # Raw mode once for the whole loop; left before handle_select (input() needs cooked mode)
+        with RawMode(), Live(render(), console=console, auto_refresh=False) as live:
             while True:
                 key = read_key()
 
                 if key == 'up':
-                    selected = (selected - 1) % total
+                    move_to((selected - 1) % total)
                     live.update(render(), refresh=True)
                 elif key == 'down':
-                    selected = (selected + 1) % total
+                    move_to((selected + 1) % total)
                     live.update(render(), refresh=True)
                 elif key in ('\r', '\n'):
-                    live.stop()
-                    print("\033[?25h", end="", flush=True)
-                    return handle_select(selected)
+                    break
                 elif key.isdigit() and 0 < int(key) <= total:
-                    live.stop()
-                    print("\033[?25h", end="", flush=True)
-                    return handle_select(int(key) - 1)
+                    selected = int(key) - 1
+                    break
                 elif key == '\x03':
                     raise KeyboardInterrupt()
                 elif key == '\x04':
                     raise EOFError()
+        print("\033[?25h", end="", flush=True)
+        return handle_select(selected)
     finally:
         print("\033[?25h", end="", flush=True)
@@ -1,15 +1,31 @@
 """Providers for CommandPalette and Input autocomplete."""
 
+import re
+from operator import itemgetter
 from pathlib import Path
 from typing import Protocol, runtime_checkable, Union
 
 from .fuzzy import fuzzy_match
 from .dropdown import DropdownItem
 
+_SEARCH_CACHE_SIZE = 128
+
+_first = itemgetter(0)
+
+# FileProvider directory listing as columns: (names, is_dirs, displays, displays lowercased)
+_Listing = tuple[list[str], list[bool], list[str], list[str]]
+
 
 @runtime_checkable
 class Provider(Protocol):
-    """Protocol for autocomplete providers."""
+    """Protocol for autocomplete providers.
+
+    Providers may also define these optional hooks, which Input calls if present:
+        on_accept(value) -> bool: handle a selected value; True if the provider
+            navigated (Input keeps the dropdown open) instead of accepting it
+        on_backspace() -> bool: handle Backspace on an empty filter; True if handled
+        on_exit(): reset provider state when autocomplete closes
+    """
 
     def search(self, query: str) -> list[Union[DropdownItem, tuple]]:
         """Return matches as DropdownItem or (display, value, score, positions) tuple."""
@@ -51,6 +67,21 @@ class StaticProvider:
             items: List of tuples or DropdownItem objects
         """
         self.items = self._normalize_items(items)
+        # Incremental filtering: a query that extends the last one can only match
+        # a subset of its hits, so only those indices into self.items are rescanned
+        self._last_items = None
+        self._last_query = None
+        self._last_hits: list[int] = []
+        # Column (struct-of-arrays) view of self.items plus the lookup structures
+        # derived from it; all rebuilt together if self.items is reassigned
+        self._index_items = None
+        self._displays: list[str] = []
+        self._values: list = []
+        self._descriptions: list[str] = []
+        self._icons: list[str] = []
+        self._lowered: list[str] = []  # display.lower() per item, for the subsequence prefilter
+        # Inverted index: lowercase char -> indices of items whose display contains it
+        self._char_index: dict[str, set[int]] = {}
 
     def _normalize_items(self, items: list) -> list[tuple]:
         """Convert items to normalized format (display, value, description, icon)."""
@@ -66,19 +97,93 @@ class StaticProvider:
                 normalized.append((item[0], item[1], item[2], item[3]))
         return normalized
 
+    def _ensure_columns(self, items: list[tuple]):
+        """(Re)build the per-field columns, lowered displays and char index if self.items was replaced."""
+        if self._index_items is not items:
+            if items:
+                displays, values, descriptions, icons = map(list, zip(*items))
+            else:
+                displays, values, descriptions, icons = [], [], [], []
+            index: dict[str, set[int]] = {}
+            lowered = [display.lower() for display in displays]
+            for idx, display_lower in enumerate(lowered):
+                for char in set(display_lower):
+                    index.setdefault(char, set()).add(idx)
+            self._displays = displays
+            self._values = values
+            self._descriptions = descriptions
+            self._icons = icons
+            self._lowered = lowered
+            self._char_index = index
+            self._index_items = items
+
+    def _candidates(self, items: list[tuple], query: str) -> list[int]:
+        """Indices of items whose display contains every char of query, in item order."""
+        # Rarest char first keeps the intersection small from the start
+        sets = sorted((self._char_index.get(char, ()) for char in set(query.lower())), key=len)
+        if not sets or not sets[0]:
+            return []
+        hits = set(sets[0])
+        for other in sets[1:]:
+            hits &= other
+            if not hits:
+                return []
+        return sorted(hits)
+
+    def _subsequence_filter(self, items: list[tuple], candidates, query: str) -> list[int]:
+        """Keep candidates whose display contains query as a subsequence.
+
+        One compiled regex (q0.*?q1.*?...) checked in C per item drops the
+        out-of-order candidates before the Python-level fuzzy_match scorer.
+        Same matching rule as fuzzy_match: lowercase, greedy subsequence.
+        """
+        search = re.compile('.*?'.join(map(re.escape, query.lower())), re.DOTALL).search
+        lowered = self._lowered
+        return [idx for idx in candidates if search(lowered[idx])]
+
     def search(self, query: str) -> list[DropdownItem]:
-        results = []
-        for display, value, description, icon in self.items:
-            matched, score, positions = fuzzy_match(query, display)
+        items = self.items
+        self._ensure_columns(items)
+        if (query and self._last_query and items is self._last_items
+                and query.startswith(self._last_query)):
+            candidates = self._last_hits
+        elif query:
+            # Only items containing every query char can match; fuzzy_match scores them
+            candidates = self._candidates(items, query)
+        else:
+            candidates = range(len(items))
+        if query and candidates:
+            candidates = self._subsequence_filter(items, candidates, query)
+
+        # Scoring reads only the display column; items are built for matches only
+        displays = self._displays
+        hits = []
+        scores = []
+        matched_positions = []
+        for idx in candidates:
+            matched, score, positions = fuzzy_match(query, displays[idx])
             if matched:
-                results.append(DropdownItem(
-                    display=display,
-                    value=value,
-                    score=score,
-                    positions=positions,
-                    description=description,
-                    icon=icon,
-                ))
+                hits.append(idx)
+                scores.append(score)
+                matched_positions.append(positions)
+
+        values = self._values
+        descriptions = self._descriptions
+        icons = self._icons
+        results = [
+            DropdownItem(
+                display=displays[idx],
+                value=values[idx],
+                score=score,
+                positions=positions,
+                description=descriptions[idx],
+                icon=icons[idx],
+            )
+            for idx, score, positions in zip(hits, scores, matched_positions)
+        ]
+        self._last_items = items
+        self._last_query = query
+        self._last_hits = hits
         return sorted(results, key=lambda x: -x.score)
 
 
@@ -97,6 +202,16 @@ class FileProvider:
         self.dirs_only = dirs_only
         self.files_only = files_only
         self._context = ""  # Current directory for nested navigation
+        # Directory listings keyed by path, validated against the dir's mtime, so a
+        # keystroke costs one stat() instead of iterdir() + a stat per entry
+        self._listing_cache: dict[str, tuple[int, _Listing]] = {}
+        # Finished results per (context, flags, query); cleared when a listing is re-read
+        self._search_cache: dict[tuple, tuple[DropdownItem, ...]] = {}
+        # Incremental filtering, as in StaticProvider: indices into the listing that
+        # matched _last_query, valid while the listing and filter flags are unchanged
+        self._last_scope = None
+        self._last_query = None
+        self._last_hits: list[int] = []
 
     @property
     def context(self) -> str:
@@ -106,39 +221,105 @@ class FileProvider:
     def context(self, value: str):
         self._context = value
 
+    def _listing(self, base: Path) -> _Listing | None:
+        """Entries of base as columns, re-read only when its mtime changes.
+
+        Columns: (names, is_dirs, displays, displays lowercased); display is
+        the name with a trailing '/' for directories.
+        """
+        try:
+            mtime = base.stat().st_mtime_ns
+        except OSError:
+            return None
+        key = str(base)
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        names = []
+        is_dirs = []
+        displays = []
+        for f in base.iterdir():
+            is_dir = f.is_dir()
+            names.append(f.name)
+            is_dirs.append(is_dir)
+            displays.append(f.name + "/" if is_dir else f.name)
+        entries = (names, is_dirs, displays, [display.lower() for display in displays])
+        self._listing_cache[key] = (mtime, entries)
+        self._search_cache.clear()  # Results built from the old listing are stale
+        return entries
+
     def search(self, query: str) -> list[DropdownItem]:
         """Search files in current context directory."""
         base = self.root / self._context if self._context else self.root
-        if not base.exists():
+        entries = self._listing(base)
+        if entries is None:
             return []
 
+        key = (self._context, self.show_hidden, self.dirs_only, self.files_only, query)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        scope = (entries, self._context, self.show_hidden, self.dirs_only, self.files_only)
+        last_scope = self._last_scope
+        if (query and self._last_query and last_scope is not None
+                and last_scope[0] is entries and last_scope[1:] == scope[1:]
+                and query.startswith(self._last_query)):
+            candidates = self._last_hits
+        else:
+            candidates = range(len(entries[0]))
+
+        names, is_dirs, displays, displays_lower = entries
         results = []
-        for f in base.iterdir():
-            if not self.show_hidden and f.name.startswith('.'):
+        hits = []
+        for idx in candidates:
+            is_dir = is_dirs[idx]
+            if not self.show_hidden and names[idx].startswith('.'):
                 continue
-            if self.dirs_only and not f.is_dir():
+            if self.dirs_only and not is_dir:
                 continue
-            if self.files_only and f.is_dir():
+            if self.files_only and is_dir:
                 continue
 
-            is_dir = f.is_dir()
-            name = f.name + ("/" if is_dir else "")
+            name = displays[idx]
             matched, score, positions = fuzzy_match(query, name)
 
             if matched:
+                hits.append(idx)
                 full_path = (self._context + name) if self._context else name
                 # Icons are handled by Dropdown based on filename
-                results.append(DropdownItem(
+                item = DropdownItem(
                     display=name,
                     value=full_path,
                     score=score,
                     positions=positions,
-                ))
+                )
+                # Sort key built from what the loop already knows (is_dir, cached lowercase)
+                results.append(((not is_dir, -score, displays_lower[idx]), item))
 
         # Sort: directories first, then by score, then alphabetically
-        results.sort(key=lambda x: (not x.display.endswith('/'), -x.score, x.display.lower()))
+        results.sort(key=_first)
+        results = [item for _, item in results]
+        self._last_scope = scope
+        self._last_query = query
+        self._last_hits = hits
+        if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+            self._search_cache.clear()
+        self._search_cache[key] = tuple(results)
         return results
 
+    def on_accept(self, value) -> bool:
+        """Input hook: a selected directory is entered instead of accepted."""
+        return isinstance(value, str) and self.enter(value)
+
+    def on_backspace(self) -> bool:
+        """Input hook: Backspace on an empty filter goes up one directory."""
+        return self.back()
+
+    def on_exit(self):
+        """Input hook: autocomplete closed, start from the root next time."""
+        self._context = ""
+
     def enter(self, path: str) -> bool:
         """Enter a directory. Returns True if successful."""
         if path.endswith('/'):
@@ -4,6 +4,8 @@ Creates a professional terminal prompt bar like powerlevel10k.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
+from rich.style import Style
 from rich.text import Text
 
 
@@ -21,6 +23,18 @@ PROGRESS_FILLED = "\u2588"  # Full block
 PROGRESS_EMPTY = "\u2591"   # Light shade
 
 
+@lru_cache(maxsize=None)
+def _progress_bars(width: int) -> tuple[str, ...]:
+    """All bar strings for a width, indexed by number of filled cells."""
+    return tuple(PROGRESS_FILLED * i + PROGRESS_EMPTY * (width - i) for i in range(width + 1))
+
+
+@lru_cache(maxsize=256)
+def _parse_style(spec: str) -> Style:
+    """Parsed Style for a segment style string, shared across renders and bars."""
+    return Style.parse(spec)
+
+
 @dataclass
 class ProgressSegment:
     """A progress bar segment for StatusBar.
@@ -41,9 +55,7 @@ class ProgressSegment:
     def render(self) -> str:
         """Render progress bar text."""
         pct = max(0, min(100, self.percent))
-        filled = int(self.width * pct / 100)
-        empty = self.width - filled
-        bar = PROGRESS_FILLED * filled + PROGRESS_EMPTY * empty
+        bar = _progress_bars(self.width)[int(self.width * pct / 100)]
         if self.show_percent:
             return f"{bar} {int(pct)}%"
         return bar
@@ -86,6 +98,9 @@ class StatusBar:
         """
         self.segments = segments
         self.use_powerline = use_powerline
+        # Last rendered Text and the segment snapshot it was built from
+        self._cache_key = None
+        self._cache_text = None
 
     def _get_bg_color(self, segment) -> str:
         """Get background color from segment."""
@@ -100,8 +115,20 @@ class StatusBar:
         icon, text, _ = segment
         return f" {icon} {text} " if icon else f" {text} "
 
+    def _snapshot(self) -> tuple:
+        """Cheap value snapshot of everything render() depends on."""
+        return (self.use_powerline,) + tuple(
+            (ProgressSegment, s.percent, s.bg_color, s.width, s.show_percent)
+            if isinstance(s, ProgressSegment) else tuple(s)  # copy: lists may be edited in place
+            for s in self.segments
+        )
+
     def render(self) -> Text:
-        """Render the status bar."""
+        """Render the status bar. Unchanged segments return a copy of the last render."""
+        key = self._snapshot()
+        if key == self._cache_key:
+            return self._cache_text.copy()
+
         result = Text()
 
         for i, segment in enumerate(self.segments):
@@ -109,23 +136,20 @@ class StatusBar:
             content = self._render_segment_content(segment)
 
             # Add segment with background
-            result.append(content, style=f"bold white on {bg_color}")
+            result.append(content, style=_parse_style(f"bold white on {bg_color}"))
 
             # Add arrow separator
+            arrow = ARROW_RIGHT if self.use_powerline else ARROW_FALLBACK
             if i < len(self.segments) - 1:
                 next_bg = self._get_bg_color(self.segments[i + 1])
-                if self.use_powerline:
-                    result.append(ARROW_RIGHT, style=f"{bg_color} on {next_bg}")
-                else:
-                    result.append(ARROW_FALLBACK, style=f"{bg_color} on {next_bg}")
+                result.append(arrow, style=_parse_style(f"{bg_color} on {next_bg}"))
             else:
                 # Final arrow to terminal background
-                if self.use_powerline:
-                    result.append(ARROW_RIGHT, style=f"{bg_color}")
-                else:
-                    result.append(ARROW_FALLBACK, style=f"{bg_color}")
+                result.append(arrow, style=_parse_style(bg_color))
 
-        return result
+        self._cache_key = key
+        self._cache_text = result
+        return result.copy()
 
 
 class SimpleStatusBar:
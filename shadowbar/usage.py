@@ -3,7 +3,8 @@ Purpose: Token usage tracking and cost calculation for LLM calls
 LLM-Note:
   Dependencies: none | imported by [llm.py, agent.py]
   Data flow: receives model name + token counts → returns cost in USD
-  Integration: exposes TokenUsage, MODEL_PRICING, MODEL_CONTEXT_LIMITS, calculate_cost(), get_context_limit()
+  Integration: exposes TokenUsage, MODEL_PRICING, MODEL_CONTEXT_LIMITS, calculate_cost(), calculate_cost_batch(), get_context_limit(), clear_caches()
+  Performance: get_pricing()/get_context_limit() and per-token rates are lru_cached per model name | call clear_caches() after editing the model tables
 
 ShadowBar Usage - Token tracking and cost calculation.
 
@@ -12,9 +13,12 @@ for Anthropic Claude models (the only LLM provider supported by ShadowBar).
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage from a single LLM call."""
     input_tokens: int = 0
@@ -26,88 +30,115 @@ class TokenUsage:
 
 # Pricing per 1M tokens (USD) - Anthropic Claude models only
 # Format: {"input": $, "output": $, "cached": $, "cache_write": $}
+# Aliases of one tier share a single read-only mapping, so a write can't silently
+# reprice every alias; to change a model's price, assign it a new dict
+_SONNET_TIER = MappingProxyType({"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75})
+_HAIKU_TIER = MappingProxyType({"input": 0.80, "output": 4.00, "cached": 0.08, "cache_write": 1.00})     # Claude 3.5 Haiku
+_OPUS_TIER = MappingProxyType({"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75})
+_HAIKU3_TIER = MappingProxyType({"input": 0.25, "output": 1.25, "cached": 0.025, "cache_write": 0.3125})  # Claude 3 Haiku
+
 MODEL_PRICING = {
     # Anthropic Claude models - cached = 10% of input, cache_write = 125% of input
-    "claude-3-5-sonnet-20241022": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-3-5-sonnet-latest": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-3-5-haiku-20241022": {"input": 0.80, "output": 4.00, "cached": 0.08, "cache_write": 1.00},
-    "claude-3-5-haiku-latest": {"input": 0.80, "output": 4.00, "cached": 0.08, "cache_write": 1.00},
-    "claude-3-opus-20240229": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
-    "claude-3-opus-latest": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
-    "claude-3-sonnet-20240229": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25, "cached": 0.025, "cache_write": 0.3125},
+    "claude-3-5-sonnet-20241022": _SONNET_TIER,
+    "claude-3-5-sonnet-latest": _SONNET_TIER,
+    "claude-3-5-haiku-20241022": _HAIKU_TIER,
+    "claude-3-5-haiku-latest": _HAIKU_TIER,
+    "claude-3-opus-20240229": _OPUS_TIER,
+    "claude-3-opus-latest": _OPUS_TIER,
+    "claude-3-sonnet-20240229": _SONNET_TIER,
+    "claude-3-haiku-20240307": _HAIKU3_TIER,
 
     # Claude 4 models
-    "claude-sonnet-4-20250514": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-sonnet-4": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-sonnet-4-0": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-opus-4-20250514": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
-    "claude-opus-4": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
-    "claude-opus-4-0": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
-    "claude-opus-4-1": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
-    "claude-opus-4-1-20250805": {"input": 15.00, "output": 75.00, "cached": 1.50, "cache_write": 18.75},
+    "claude-sonnet-4-20250514": _SONNET_TIER,
+    "claude-sonnet-4": _SONNET_TIER,
+    "claude-sonnet-4-0": _SONNET_TIER,
+    "claude-opus-4-20250514": _OPUS_TIER,
+    "claude-opus-4": _OPUS_TIER,
+    "claude-opus-4-0": _OPUS_TIER,
+    "claude-opus-4-1": _OPUS_TIER,
+    "claude-opus-4-1-20250805": _OPUS_TIER,
 
     # Claude 3.7 models
-    "claude-3-7-sonnet-latest": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    "claude-3-7-sonnet-20250219": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
-    
+    "claude-3-7-sonnet-latest": _SONNET_TIER,
+    "claude-3-7-sonnet-20250219": _SONNET_TIER,
+
     # Claude 4.5 models
-    "claude-sonnet-4-5": {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75},
+    "claude-sonnet-4-5": _SONNET_TIER,
 }
 
 # Context window limits (tokens) - Anthropic Claude models only
-MODEL_CONTEXT_LIMITS = {
-    # Anthropic Claude models
-    "claude-3-5-sonnet-20241022": 200000,
-    "claude-3-5-sonnet-latest": 200000,
-    "claude-3-5-haiku-20241022": 200000,
-    "claude-3-5-haiku-latest": 200000,
-    "claude-3-opus-20240229": 200000,
-    "claude-3-opus-latest": 200000,
-    "claude-3-sonnet-20240229": 200000,
-    "claude-3-haiku-20240307": 200000,
-    "claude-sonnet-4-20250514": 200000,
-    "claude-sonnet-4": 200000,
-    "claude-sonnet-4-0": 200000,
-    "claude-opus-4-20250514": 200000,
-    "claude-opus-4": 200000,
-    "claude-opus-4-0": 200000,
-    "claude-opus-4-1": 200000,
-    "claude-opus-4-1-20250805": 200000,
-    "claude-3-7-sonnet-latest": 200000,
-    "claude-3-7-sonnet-20250219": 200000,
-    "claude-sonnet-4-5": 200000,
-}
+# Every known Claude model has a 200K window, so the table is built from MODEL_PRICING's names
+MODEL_CONTEXT_LIMITS = dict.fromkeys(MODEL_PRICING, 200000)
 
 # Default values for unknown models (assuming Claude-like)
-DEFAULT_PRICING = {"input": 3.00, "output": 15.00, "cached": 0.30, "cache_write": 3.75}
+DEFAULT_PRICING = _SONNET_TIER
 DEFAULT_CONTEXT_LIMIT = 200000
 
 
-def get_pricing(model: str) -> dict:
-    """Get pricing for a model, with fallback to default."""
+# Family prefix of each known model ("claude-3-5-sonnet-20241022" -> "claude-3-5-sonnet"),
+# split on first use (and again after clear_caches()), in table order (first match wins)
+@lru_cache(maxsize=None)
+def _pricing_prefixes() -> tuple:
+    return tuple((m.rsplit('-', 1)[0], p) for m, p in MODEL_PRICING.items())
+
+
+@lru_cache(maxsize=None)
+def _context_prefixes() -> tuple:
+    return tuple((m.rsplit('-', 1)[0], n) for m, n in MODEL_CONTEXT_LIMITS.items())
+
+
+def _match_prefix(model: str, prefixes: tuple, default):
+    """Value of the first known family prefix that model starts with, else default."""
+    for prefix, value in prefixes:
+        if model.startswith(prefix):
+            return value
+    return default
+
+
+@lru_cache(maxsize=128)
+def get_pricing(model: str) -> Mapping[str, float]:
+    """Get pricing for a model, with fallback to default.
+
+    Built-in tiers are read-only mappings shared between aliases.
+
+    Memoized per model name; call clear_caches() after editing MODEL_PRICING.
+    """
     # Try exact match
     if model in MODEL_PRICING:
         return MODEL_PRICING[model]
 
     # Try prefix match (e.g., "claude-3-5-sonnet-2024" -> "claude-3-5-sonnet-20241022")
-    for known_model in MODEL_PRICING:
-        if model.startswith(known_model.rsplit('-', 1)[0]):
-            return MODEL_PRICING[known_model]
+    return _match_prefix(model, _pricing_prefixes(), DEFAULT_PRICING)
+
 
-    return DEFAULT_PRICING
+@lru_cache(maxsize=128)
+def _get_rate(model: str) -> dict:
+    """Per-token USD rates for a model: get_pricing() scaled by 1e-6, "cached" always set."""
+    rate = {key: price * 1e-6 for key, price in get_pricing(model).items()}
+    rate.setdefault("cached", rate["input"] * 0.1)
+    return rate
 
 
+@lru_cache(maxsize=128)
 def get_context_limit(model: str) -> int:
-    """Get context limit for a model, with fallback to default."""
+    """Get context limit for a model, with fallback to default.
+
+    Memoized per model name; call clear_caches() after editing MODEL_CONTEXT_LIMITS.
+    """
     if model in MODEL_CONTEXT_LIMITS:
         return MODEL_CONTEXT_LIMITS[model]
 
-    for known_model in MODEL_CONTEXT_LIMITS:
-        if model.startswith(known_model.rsplit('-', 1)[0]):
-            return MODEL_CONTEXT_LIMITS[known_model]
+    return _match_prefix(model, _context_prefixes(), DEFAULT_CONTEXT_LIMIT)
+
 
-    return DEFAULT_CONTEXT_LIMIT
+def clear_caches() -> None:
+    """Forget memoized lookups after editing MODEL_PRICING, MODEL_CONTEXT_LIMITS or the defaults.
+
+    Clears the per-model results and the family prefix tables built from
+    the model tables, so added or changed models take effect.
+    """
+    for cached in (get_pricing, _get_rate, get_context_limit, _pricing_prefixes, _context_prefixes):
+        cached.cache_clear()
 
 
 def calculate_cost(
@@ -129,21 +160,64 @@ def calculate_cost(
     Returns:
         Cost in USD
     """
-    pricing = get_pricing(model)
+    rate = _get_rate(model)
 
     # Non-cached input tokens = total input - cached
     non_cached_input = max(0, input_tokens - cached_tokens)
 
-    # Calculate costs (pricing is per 1M tokens)
-    input_cost = (non_cached_input / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    cached_cost = (cached_tokens / 1_000_000) * pricing.get("cached", pricing["input"] * 0.1)
+    # Per-token rates, skipping zero counts (most calls have no cache traffic)
+    cost = 0.0
+    if non_cached_input:
+        cost += non_cached_input * rate["input"]
+    if output_tokens:
+        cost += output_tokens * rate["output"]
+    if cached_tokens:
+        cost += cached_tokens * rate["cached"]
 
     # Cache write cost (Anthropic)
-    cache_write_cost = 0.0
-    if cache_write_tokens > 0 and "cache_write" in pricing:
-        cache_write_cost = (cache_write_tokens / 1_000_000) * pricing["cache_write"]
+    if cache_write_tokens > 0 and "cache_write" in rate:
+        cost += cache_write_tokens * rate["cache_write"]
 
-    return input_cost + output_cost + cached_cost + cache_write_cost
+    return cost
+
+
+def calculate_cost_batch(
+    model: str,
+    input_tokens: Sequence[int],
+    output_tokens: Sequence[int],
+    cached_tokens: Optional[Sequence[int]] = None,
+    cache_write_tokens: Optional[Sequence[int]] = None,
+) -> list[float]:
+    """Calculate USD cost for many calls to one model (e.g. a session rollup).
 
+    Gives the same value per call as calculate_cost(), but the model's rates
+    are resolved once and the loop runs in a single list comprehension.
 
+    Args:
+        model: Model name
+        input_tokens: Total input tokens per call (includes cached)
+        output_tokens: Output/completion tokens per call
+        cached_tokens: Tokens read from cache per call (default: none)
+        cache_write_tokens: Tokens written to cache per call (default: none)
+
+    Returns:
+        Cost in USD per call
+
+    Raises:
+        ValueError: If the sequences have different lengths
+    """
+    rate = _get_rate(model)
+    r_input, r_output, r_cached = rate["input"], rate["output"], rate["cached"]
+    r_write = rate.get("cache_write", 0.0)
+
+    zeros = [0] * len(input_tokens)
+    return [
+        max(0, i - c) * r_input + o * r_output + c * r_cached + (w * r_write if w > 0 else 0.0)
+        for i, o, c, w in zip(
+            input_tokens,
+            output_tokens,
+            zeros if cached_tokens is None else cached_tokens,
+            zeros if cache_write_tokens is None else cache_write_tokens,
+            strict=True,
+        )
+    ]
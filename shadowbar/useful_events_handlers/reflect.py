@@ -17,46 +17,66 @@ Usage:
 """
 
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional
 from ..events import after_tools
 from ..llm_do import llm_do
 
 if TYPE_CHECKING:
     from ..agent import Agent
 
-# Path to reflect prompt (inside shadowbar package for proper packaging)
-REFLECT_PROMPT = Path(__file__).parent.parent / "prompt_files" / "reflect.md"
+# Reflect prompt (inside shadowbar package for proper packaging), read once at import
+REFLECT_PROMPT = (Path(__file__).parent.parent / "prompt_files" / "reflect.md").read_text(encoding="utf-8").strip()
 
 
-def _compress_messages(messages: List[Dict], tool_result_limit: int = 150) -> str:
+def _compress_messages(messages: List[Dict], tool_result_limit: int = 150, max_messages: int = 40,
+                       cache: Optional[Dict] = None) -> str:
     """
     Compress conversation messages with structure:
     - USER messages ? Keep FULL
     - ASSISTANT tool_calls ? Keep parameters FULL
     - ASSISTANT text ? Keep FULL
     - TOOL results ? Truncate to tool_result_limit chars
+
+    Only the last max_messages messages are included, so each reflection
+    stays bounded no matter how long the session runs.
+
+    cache (optional, kept by the caller across calls) maps id(msg) to
+    (msg, line) for assistant tool_calls messages, which never change once
+    appended. Holding msg keeps its id from being reused while cached.
     """
+    if len(messages) > max_messages:
+        messages = messages[-max_messages:]
+
     lines = []
+    add = lines.append
 
     for msg in messages:
         role = msg['role']
 
         if role == 'user':
-            lines.append(f"USER: {msg['content']}")
+            add(f"USER: {msg['content']}")
 
         elif role == 'assistant':
             if 'tool_calls' in msg:
-                tools = [f"{tc['function']['name']}({tc['function']['arguments']})"
-                         for tc in msg['tool_calls']]
-                lines.append(f"ASSISTANT: {', '.join(tools)}")
+                hit = cache.get(id(msg)) if cache is not None else None
+                if hit is not None and hit[0] is msg:
+                    add(hit[1])
+                    continue
+                line = "ASSISTANT: " + ", ".join([f"{tc['function']['name']}({tc['function']['arguments']})"
+                                                  for tc in msg['tool_calls']])
+                if cache is not None:
+                    cache[id(msg)] = (msg, line)
+                add(line)
             else:
-                lines.append(f"ASSISTANT: {msg['content']}")
+                add(f"ASSISTANT: {msg['content']}")
 
         elif role == 'tool':
             result = msg['content']
             if len(result) > tool_result_limit:
-                result = result[:tool_result_limit] + '...'
-            lines.append(f"TOOL: {result}")
+                # One f-string: no intermediate truncated copy
+                add(f"TOOL: {result[:tool_result_limit]}...")
+            else:
+                add(f"TOOL: {result}")
 
     return "\n".join(lines)
 
@@ -80,7 +100,11 @@ def reflect(agent: 'Agent') -> None:
     tool_args = trace['arguments']
     status = trace['status']
 
-    conversation = _compress_messages(agent.current_session['messages'])
+    # Rendered tool-call lines live as long as the session
+    conversation = _compress_messages(
+        agent.current_session['messages'],
+        cache=agent.current_session.setdefault('reflect_line_cache', {})
+    )
 
     if status == 'success':
         tool_result = trace['result']
@@ -31,7 +31,40 @@ if TYPE_CHECKING:
 _console = Console()
 
 # Calendar methods that create/modify/delete events
-WRITE_METHODS = ('create_event', 'create_meet', 'update_event', 'delete_event')
+WRITE_METHODS = frozenset({'create_event', 'create_meet', 'update_event', 'delete_event'})
+
+# Approval options after the per-action "Yes, ..." option
+_APPROVE_ALL = "Auto approve all calendar actions this session"
+_REJECT = "No, tell agent what I want"
+
+# Preview layout per write method: (action, fields, show_description)
+# Each field is (label, style, argument key, optional, note after the value);
+# optional fields are left out of the preview when the argument is empty
+_PREVIEWS = {
+    'create_event': ("Create Event", (
+        ("Title: ", "bold cyan", 'title', False, ""),
+        ("Start: ", "bold cyan", 'start_time', False, ""),
+        ("End: ", "bold cyan", 'end_time', False, ""),
+        ("Attendees: ", "bold yellow", 'attendees', True, " (will receive invite!)"),
+        ("Location: ", "bold cyan", 'location', True, ""),
+    ), True),
+    'create_meet': ("Create Meeting", (
+        ("Title: ", "bold cyan", 'title', False, ""),
+        ("Start: ", "bold cyan", 'start_time', False, ""),
+        ("End: ", "bold cyan", 'end_time', False, ""),
+        ("Attendees: ", "bold yellow", 'attendees', False, " (will receive Meet invite!)"),
+    ), True),
+    'update_event': ("Update Event", (
+        ("Event ID: ", "bold cyan", 'event_id', False, ""),
+        ("New Title: ", "bold cyan", 'title', True, ""),
+        ("New Start: ", "bold cyan", 'start_time', True, ""),
+        ("New End: ", "bold cyan", 'end_time', True, ""),
+        ("New Attendees: ", "bold yellow", 'attendees', True, " (will be notified!)"),
+    ), False),
+    'delete_event': ("Delete Event", (
+        ("Event ID: ", "bold red", 'event_id', False, ""),
+    ), False),
+}
 
 
 @before_each_tool
@@ -41,115 +74,46 @@ def check_calendar_approval(agent: 'Agent') -> None:
     Raises:
         ValueError: If user rejects the action
     """
+    # Runs before every tool call: reject non-calendar tools first
     pending = agent.current_session.get('pending_tool')
-    if not pending:
+    if not pending or pending['name'] not in WRITE_METHODS:
         return
 
-    tool_name = pending['name']
-    if tool_name not in WRITE_METHODS:
-        return
-
-    args = pending['arguments']
-
     # Skip if all calendar actions auto-approved
     if agent.current_session.get('calendar_approve_all', False):
         return
 
-    preview = Text()
-
-    if tool_name == 'create_event':
-        title = args.get('title', '')
-        start = args.get('start_time', '')
-        end = args.get('end_time', '')
-        attendees = args.get('attendees', '')
-        location = args.get('location', '')
-        description = args.get('description', '')
-
-        preview.append("Title: ", style="bold cyan")
-        preview.append(f"{title}\n")
-        preview.append("Start: ", style="bold cyan")
-        preview.append(f"{start}\n")
-        preview.append("End: ", style="bold cyan")
-        preview.append(f"{end}\n")
-        if attendees:
-            preview.append("Attendees: ", style="bold yellow")
-            preview.append(f"{attendees} (will receive invite!)\n")
-        if location:
-            preview.append("Location: ", style="bold cyan")
-            preview.append(f"{location}\n")
-        if description:
-            preview.append("\n")
-            preview.append(description[:300])
+    tool_name = pending['name']
+    args = pending['arguments']
+    action, fields, show_description = _PREVIEWS[tool_name]
 
-        action = "Create Event"
+    preview = Text()
+    for label, style, key, optional, note in fields:
+        value = args.get(key, '')
+        if value or not optional:
+            preview.append(label, style=style)
+            preview.append(f"{value}{note}\n")
 
-    elif tool_name == 'create_meet':
-        title = args.get('title', '')
-        start = args.get('start_time', '')
-        end = args.get('end_time', '')
-        attendees = args.get('attendees', '')
+    if show_description:
         description = args.get('description', '')
-
-        preview.append("Title: ", style="bold cyan")
-        preview.append(f"{title}\n")
-        preview.append("Start: ", style="bold cyan")
-        preview.append(f"{start}\n")
-        preview.append("End: ", style="bold cyan")
-        preview.append(f"{end}\n")
-        preview.append("Attendees: ", style="bold yellow")
-        preview.append(f"{attendees} (will receive Meet invite!)\n")
         if description:
             preview.append("\n")
             preview.append(description[:300])
 
-        action = "Create Meeting"
-
-    elif tool_name == 'update_event':
-        event_id = args.get('event_id', '')
-        title = args.get('title', '')
-        start = args.get('start_time', '')
-        end = args.get('end_time', '')
-        attendees = args.get('attendees', '')
-
-        preview.append("Event ID: ", style="bold cyan")
-        preview.append(f"{event_id}\n")
-        if title:
-            preview.append("New Title: ", style="bold cyan")
-            preview.append(f"{title}\n")
-        if start:
-            preview.append("New Start: ", style="bold cyan")
-            preview.append(f"{start}\n")
-        if end:
-            preview.append("New End: ", style="bold cyan")
-            preview.append(f"{end}\n")
-        if attendees:
-            preview.append("New Attendees: ", style="bold yellow")
-            preview.append(f"{attendees} (will be notified!)\n")
-
-        action = "Update Event"
-
-    elif tool_name == 'delete_event':
-        event_id = args.get('event_id', '')
-
-        preview.append("Event ID: ", style="bold red")
-        preview.append(f"{event_id}\n")
+    if tool_name == 'delete_event':
         preview.append("\n", style="bold red")
         preview.append("This will permanently delete the event!", style="red")
 
-        action = "Delete Event"
-
     _console.print()
     _console.print(Panel(preview, title=f"[yellow]{action}[/yellow]", border_style="yellow"))
 
-    options = [f"Yes, {action.lower()}"]
-    options.append("Auto approve all calendar actions this session")
-    options.append("No, tell agent what I want")
-
-    choice = pick(f"Proceed with {action.lower()}?", options, console=_console)
+    approve = f"Yes, {action.lower()}"
+    choice = pick(f"Proceed with {action.lower()}?", [approve, _APPROVE_ALL, _REJECT], console=_console)
 
-    if choice.startswith("Yes"):
+    # pick returns the option string itself, so these compare by identity first
+    if choice == approve:
         return
-    elif choice == "Auto approve all calendar actions this session":
+    elif choice == _APPROVE_ALL:
         agent.current_session['calendar_approve_all'] = True
         return
     else:
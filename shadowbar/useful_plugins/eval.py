@@ -3,7 +3,7 @@ Purpose: Evaluation plugin for testing and debugging agent prompts and tools
 LLM-Note:
   Dependencies: imports from [pathlib, typing, events.after_user_input, events.on_complete, llm_do] | imported by [useful_plugins/__init__.py] | uses prompt files [prompt_files/eval_expected.md, prompt_files/react_evaluate.md] | tested by [tests/unit/test_eval_plugin.py]
   Data flow: after_user_input -> generate_expected() creates expected outcome using llm_do() -> stores in agent.current_session['expected'] | on_complete -> evaluate_result() compares actual vs expected using llm_do() -> stores evaluation in agent.current_session['evaluation']
-  State/Effects: modifies agent.current_session['expected'] and ['evaluation'] | makes LLM calls for expectation generation and evaluation | no file I/O | no network besides LLM
+  State/Effects: modifies agent.current_session['expected'] and ['evaluation'] | makes LLM calls for expectation generation and evaluation | prompt files read once at import | no network besides LLM
   Integration: exposes eval plugin list with [generate_expected, evaluate_result] handlers | used via Agent(plugins=[eval]) | combines with re_act for full debugging
   Performance: 2 LLM calls per task (generate + evaluate) | adds latency but enables automated testing
   Errors: no explicit error handling | LLM failures propagate | skips if expected already set by re_act
@@ -33,9 +33,10 @@ from ..llm_do import llm_do
 if TYPE_CHECKING:
     from ..agent import Agent
 
-# Prompts
-EXPECTED_PROMPT = Path(__file__).parent.parent / "prompt_files" / "eval_expected.md"
-EVALUATE_PROMPT = Path(__file__).parent.parent / "prompt_files" / "react_evaluate.md"
+# Prompts (read once at import; llm_do takes the text directly)
+_PROMPT_DIR = Path(__file__).parent.parent / "prompt_files"
+EXPECTED_PROMPT = (_PROMPT_DIR / "eval_expected.md").read_text(encoding="utf-8").strip()
+EVALUATE_PROMPT = (_PROMPT_DIR / "react_evaluate.md").read_text(encoding="utf-8").strip()
 
 
 @after_user_input
@@ -1,11 +1,11 @@
 """
 Purpose: Automatically format base64 image tool results for multimodal LLM consumption
 LLM-Note:
-  Dependencies: imports from [re, typing, events.after_tools] | imported by [useful_plugins/__init__.py] | tested by [tests/unit/test_image_result_formatter.py]
-  Data flow: after_tools event -> scans tool result messages for base64 images -> detects data URL or raw base64 patterns -> converts tool result message content to OpenAI vision API format with image_url type -> allows LLM to visually interpret screenshots/images
+  Dependencies: imports from [binascii, re, typing, events.after_tools] | imported by [useful_plugins/__init__.py] | tested by [tests/unit/test_image_result_formatter.py]
+  Data flow: after_tools event -> scans tool result messages for base64 images -> detects data URL or raw base64 (by PNG/JPEG/GIF/WEBP magic bytes) -> converts tool result message content to OpenAI vision API format with image_url type -> allows LLM to visually interpret screenshots/images
   State/Effects: modifies agent.current_session['messages'] in place | replaces text content with image content blocks | no file I/O | no network
   Integration: exposes image_result_formatter plugin list with [format_images] handler | used via Agent(plugins=[image_result_formatter]) | works with screenshot tools, image generators
-  Performance: O(n) message scanning | regex pattern matching | no LLM calls
+  Performance: message scan bounded to the current tool batch | precompiled data-URL regex gated by str.find | raw base64 sniffed from its first 16 chars | no LLM calls
   Errors: silent skip if no base64 images detected | malformed base64 may cause LLM confusion
 
 Image Result Formatter Plugin - Automatically formats base64 image results for model consumption.
@@ -21,6 +21,7 @@ Usage:
     agent = Agent("assistant", tools=[take_screenshot], plugins=[image_result_formatter])
 """
 
+import binascii
 import re
 from typing import TYPE_CHECKING
 from ..events import after_tools
@@ -29,6 +30,33 @@ if TYPE_CHECKING:
     from ..agent import Agent
 
 
+# Compiled once; screenshot results can be hundreds of KB of base64
+_DATA_URL_RE = re.compile(r'data:image/(png|jpeg|jpg|gif|webp);base64,([A-Za-z0-9+/=]+)')
+
+# Leading bytes of each supported image format (WEBP is RIFF....WEBP, checked separately)
+_IMAGE_MAGIC = (
+    (b'\x89PNG\r\n\x1a\n', "image/png"),
+    (b'\xff\xd8\xff', "image/jpeg"),
+    (b'GIF8', "image/gif"),
+)
+
+
+def _sniff_image_mime(data: str) -> str:
+    """MIME type from the magic bytes at the start of base64 data, or "" if not an image."""
+    # 16 base64 chars -> 12 bytes, enough for every signature above
+    head = ''.join(data[:32].split())[:16]
+    try:
+        raw = binascii.a2b_base64(head)
+    except binascii.Error:
+        return ""
+    for magic, mime_type in _IMAGE_MAGIC:
+        if raw.startswith(magic):
+            return mime_type
+    if raw[:4] == b'RIFF' and raw[8:12] == b'WEBP':
+        return "image/webp"
+    return ""
+
+
 def _is_base64_image(text: str) -> tuple[bool, str, str]:
     """
     Check if text contains base64 image data.
@@ -40,8 +68,10 @@ def _is_base64_image(text: str) -> tuple[bool, str, str]:
         return False, "", ""
 
     # Check for data URL format: data:image/png;base64,iVBORw0KGgo...
-    data_url_pattern = r'data:image/(png|jpeg|jpg|gif|webp);base64,([A-Za-z0-9+/=]+)'
-    match = re.search(data_url_pattern, text)
+    # str.find skips the regex entirely for the common no-data-URL result,
+    # and the search starts at the first candidate instead of position 0
+    start = text.find('data:image/')
+    match = _DATA_URL_RE.search(text, start) if start >= 0 else None
 
     if match:
         image_type = match.group(1)
@@ -50,10 +80,13 @@ def _is_base64_image(text: str) -> tuple[bool, str, str]:
         return True, mime_type, base64_data
 
     # Check if entire result is base64 (common for screenshot tools)
-    # Base64 strings are typically long and contain only valid base64 characters
-    if len(text) > 100 and re.match(r'^[A-Za-z0-9+/=\s]+$', text):
-        # Likely a base64 image, default to PNG
-        return True, "image/png", text.strip()
+    # Decoding the first few chars and checking the image signature is O(1);
+    # the rest of the payload is not validated (the LLM rejects bad images)
+    if len(text) > 100:
+        base64_data = text.strip()
+        mime_type = _sniff_image_mime(base64_data)
+        if mime_type:
+            return True, mime_type, base64_data
 
     return False, "", ""
 
@@ -93,9 +126,14 @@ def _format_image_result(agent: 'Agent') -> None:
     # while also providing image in user message (only format that supports images)
     messages = agent.current_session['messages']
 
+    # The result sits in the current batch at the tail (usually messages[-1]),
+    # so the scan never needs to go past the assistant message that issued it
     for i in range(len(messages) - 1, -1, -1):
         msg = messages[i]
 
+        if msg['role'] == 'assistant' and msg.get('tool_calls'):
+            break
+
         if msg['role'] == 'tool' and msg.get('tool_call_id') == tool_call_id:
             # Shorten the tool message content (remove base64 to save tokens)
             messages[i]['content'] = f"Screenshot captured (image provided below)"
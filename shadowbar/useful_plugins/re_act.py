@@ -3,7 +3,7 @@ Purpose: ReAct (Reasoning + Acting) plugin that adds planning and reflection to
 LLM-Note:
   Dependencies: imports from [pathlib, typing, events.after_user_input, llm_do, useful_events_handlers.reflect] | imported by [useful_plugins/__init__.py] | uses prompt file [prompt_files/react_plan.md] | tested by [tests/unit/test_re_act_plugin.py]
   Data flow: after_user_input -> plan_task() generates a plan using llm_do() -> stores in agent.current_session['plan'] -> after_tools -> reflect() from useful_events_handlers evaluates results -> generates reflection for next step
-  State/Effects: modifies agent.current_session['plan'] and ['expected'] | makes LLM calls for planning and reflection | no file I/O | no network besides LLM
+  State/Effects: modifies agent.current_session['plan'] and ['expected'] | makes LLM calls for planning and reflection | prompt file read once at import | no network besides LLM
   Integration: exposes re_act plugin list with [plan_task, reflect] event handlers | used via Agent(plugins=[re_act]) | works with eval plugin for debugging
   Performance: 1-2 LLM calls per turn (plan + reflect) | adds latency but improves agent reasoning
   Errors: no explicit error handling | LLM failures propagate | silent skip if no user_prompt
@@ -36,8 +36,8 @@ from ..useful_events_handlers.reflect import reflect
 if TYPE_CHECKING:
     from ..agent import Agent
 
-# Prompts
-PLAN_PROMPT = Path(__file__).parent.parent / "prompt_files" / "react_plan.md"
+# Prompts (read once at import; llm_do takes the text directly)
+PLAN_PROMPT = (Path(__file__).parent.parent / "prompt_files" / "react_plan.md").read_text(encoding="utf-8").strip()
 
 
 @after_user_input